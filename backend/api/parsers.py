@@ -0,0 +1,52 @@
+import codecs
+import io
+import re
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+# Optional C-accelerated decoder for request bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson silently turns integers outside the signed/unsigned 64-bit range into
+# floats. Every such literal has at least 19 digits, so bodies containing a
+# 19-digit run (even inside a string or a fraction) use the stock parser.
+_WIDE_NUMBER_RE = re.compile(rb'\d{19}')
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser that decodes with orjson when it is installed.
+
+    Parsed values always match the stock parser's. Bodies orjson would read
+    differently (integers wider than 64 bits) or refuse (e.g. 1e400, which the
+    stdlib reads as infinity) go through JSONParser, as do non-UTF-8 request
+    encodings, non-strict mode and installs without orjson.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if (
+            orjson is None
+            or not self.strict
+            or codecs.lookup(encoding).name != 'utf-8'
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        raw = stream.read()
+        if not _WIDE_NUMBER_RE.search(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Let the stock parser accept what it accepts and word the
+                # ParseError for what it doesn't
+                pass
+        return super().parse(io.BytesIO(raw), media_type, parser_context)
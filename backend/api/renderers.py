@@ -0,0 +1,72 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Optional C-accelerated encoder for API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Types orjson can't encode natively (Decimal, lazy strings, querysets, ...)
+# go through the same conversions DRF's encoder applies; datetimes are passed
+# through too, so they keep DRF's format ("Z" suffix, millisecond precision)
+_encode_default = JSONEncoder().default
+
+
+def _has_non_finite_float(data):
+    """True if a NaN/Infinity float appears anywhere in the rendered data."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed.
+
+    Output is compact UTF-8 JSON that decodes to the same values DRF's
+    renderer produces. It is not always byte-identical: floats that Python
+    spells with an exponent come out in orjson's shortest form (1e-05 as
+    0.00001, 1e+16 as 1e16). Values orjson can't represent the same way
+    (integers wider than 64 bits, NaN/Infinity, which orjson writes as null
+    where strict DRF refuses them), indented responses and installs without
+    orjson go through the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=_encode_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson writes NaN/Infinity as null; only payloads containing a null
+        # can hide one, and those are re-checked so DRF can reject (or, in
+        # non-strict mode, spell out) the value
+        if b'null' in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep DRF's escaping of the JavaScript line terminators U+2028/U+2029
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+            b'\xe2\x80\xa9', b'\\u2029'
+        )
@@ -1,3 +1,86 @@
-from django.test import TestCase
+# api/tests.py
+"""
+API Rendering & Parsing Test Suite
+==================================
 
-# Create your tests here.
+Tests for the orjson-backed renderer and parser used by every endpoint.
+
+Test Categories:
+----------------
+1. Renderer Tests - Parity with DRF's JSONRenderer
+"""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from .renderers import ORJSONRenderer
+
+
+# ===========================================================================
+# RENDERER TESTS
+# ===========================================================================
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer output must decode to what JSONRenderer's does."""
+
+    def assertSameAsDRF(self, data, media_type=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_matches_drf_for_common_payloads(self):
+        self.assertSameAsDRF({
+            "id": 1,
+            "score": 0.65,
+            "flags": [True, False, None],
+            "title": "Caf\u00e9 line\u2028separator",
+            "error": ErrorDetail("bad value", code="invalid"),
+            "lazy": _("User not found"),
+            "amount": Decimal("1.50"),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            7: "non-string key",
+        })
+
+    def test_matches_drf_for_datetimes(self):
+        self.assertSameAsDRF({
+            "aware": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            "naive": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "date": datetime.date(2024, 1, 2),
+            "time": datetime.time(3, 4, 5, 678901),
+        })
+
+    def test_matches_drf_for_wide_integers(self):
+        self.assertSameAsDRF({"big": 2 ** 70, "negative": -(2 ** 65)})
+
+    def test_exponent_floats_decode_to_the_same_values(self):
+        """Float spelling may differ (0.00001 vs 1e-05); the values may not."""
+        data = {"small": 0.00001, "tiny": 1.5e-300, "large": 1e16, "huge": 2.5e300}
+
+        ours = ORJSONRenderer().render(data)
+        drf = JSONRenderer().render(data)
+
+        self.assertEqual(json.loads(ours), json.loads(drf))
+        self.assertEqual(json.loads(ours), data)
+
+    def test_matches_drf_with_indent(self):
+        self.assertSameAsDRF({"a": [1, 2]}, "application/json; indent=2")
+
+    def test_non_finite_floats_are_rejected_like_drf(self):
+        for value in (float("nan"), float("inf")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({"score": value})
+                with self.assertRaises(ValueError):
+                    ORJSONRenderer().render({"score": value})
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
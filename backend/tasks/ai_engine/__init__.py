@@ -52,7 +52,7 @@ Usage:
 """
 
 from .cache import AIScoringCache
-from .celery_tasks import run_ai_relevance_scoring
+from .celery_tasks import run_ai_relevance_scoring, run_batch_ai_relevance_scoring
 from .external_scorer import ExternalAIScorer
 from .orchestrator import (
     SCORING_METHOD_AI,
@@ -73,6 +73,7 @@ __all__ = [
     # Functions
     "compute_urgency",
     "run_ai_relevance_scoring",
+    "run_batch_ai_relevance_scoring",
     # Constants
     "SCORING_METHOD_AI",
     "SCORING_METHOD_CACHE",
@@ -3,7 +3,7 @@
 import json
 import hashlib
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from django.core.cache import cache
 from django.conf import settings
 
@@ -26,7 +26,7 @@ class AIScoringCache:
     def __init__(
         self, 
         ttl: int = 86400, 
-        version: str = "v1",
+        version: str = "v2",
         cache_alias: str = "default"
     ):
         """
@@ -77,6 +77,31 @@ class AIScoringCache:
         result = scoring_func()
 
         # 4. Persistence: Attempt to update cache for future requests
+        self._store(cache_key, result)
+
+        return result
+
+    def set_score(
+        self,
+        task_title: str,
+        task_description: str,
+        user_weights: Dict[str, float],
+        result: Dict[str, Any],
+    ) -> None:
+        """
+        Stores a score computed outside get_or_set_score (e.g. a batch AI call).
+
+        Args:
+            task_title: Input title for hashing.
+            task_description: Input description for hashing.
+            user_weights: Dictionary of weight keys/values for hashing.
+            result: The relevance score dictionary to cache.
+        """
+        cache_key = self._generate_key(task_title, task_description, user_weights)
+        self._store(cache_key, result)
+
+    def _store(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Persists a result unless it is a fallback, swallowing Redis errors."""
         try:
             # Verify result is not a fallback/empty before caching to prevent poisoning
             if result.get("confidence", 0) > 0:
@@ -84,7 +109,36 @@ class AIScoringCache:
         except Exception as e:
             logger.error(f"Redis persistence failure: {str(e)}")
 
-        return result
+    def get_many_scores(
+        self,
+        inputs: List[Tuple[str, str, Dict[str, float]]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Batch cache lookup for several tasks in a single round-trip.
+
+        Uses the cache backend's get_many (an MGET on Redis) instead of
+        issuing one GET per task.
+
+        Args:
+            inputs: List of (task_title, task_description, user_weights) tuples.
+
+        Returns:
+            Cached result per input, in the same order; None on cache miss.
+        """
+        keys = [
+            self._generate_key(title, description, weights)
+            for title, description, weights in inputs
+        ]
+
+        try:
+            found = cache.get_many(keys)
+        except Exception as e:
+            # Transparently handle Redis connectivity issues (treat as all-miss)
+            logger.error(f"Redis batch retrieval failure: {str(e)}")
+            found = {}
+
+        logger.debug(f"AI Cache batch lookup: {len(found)}/{len(keys)} hits")
+        return [found.get(key) for key in keys]
 
     def _generate_key(
         self, 
@@ -95,18 +149,62 @@ class AIScoringCache:
         """
         Creates a stable SHA256 hash from input parameters.
         
-        Keys are sorted to ensure that identical weight dictionaries 
-        generate identical hashes regardless of insertion order.
+        Only the weight KEYS (the domains) are hashed: the scorer never sends
+        weight values to the AI, so relevance is the same for any weighting
+        of the same domains. A user changing their weights therefore reuses
+        earlier AI results instead of re-scoring every task. Title and
+        description are case- and whitespace-normalized so trivially
+        different copies of a recurring task share one entry.
         """
         # Create a stable, sorted representation of the input payload
         payload = {
-            "title": title.strip().lower(),
-            "description": description.strip().lower(),
-            "weights": sorted(weights.items()),
+            "title": " ".join(title.lower().split()),
+            "description": " ".join(description.lower().split()),
+            "domains": sorted(weights),
             "version": self.version
         }
         
         serialized_payload = json.dumps(payload, sort_keys=True)
         hash_digest = hashlib.sha256(serialized_payload.encode()).hexdigest()
         
-        return f"ai_score_{self.version}_{hash_digest}"
\ No newline at end of file
+        return f"ai_score_{self.version}_{hash_digest}"
+
+
+# ---------------------------------------------------------------------------
+# Per-user weights cache
+# ---------------------------------------------------------------------------
+
+# Workers receive only (task_id, user_id); weights are looked up here first.
+# Entries are deleted whenever GoalWeights or Goals change (see tasks.signals),
+# so the TTL only bounds how long an orphaned entry lingers.
+USER_WEIGHTS_CACHE_TTL = 3600
+
+
+def user_weights_cache_key(user_id: int) -> str:
+    """Cache key holding the normalized weights of one user."""
+    return f"user_weights:{user_id}"
+
+
+def get_cached_user_weights(user_id: int) -> Optional[Dict[str, float]]:
+    """Returns the cached weights for a user, or None on miss/Redis failure."""
+    try:
+        return cache.get(user_weights_cache_key(user_id))
+    except Exception as e:
+        logger.error(f"Redis retrieval failure: {str(e)}")
+        return None
+
+
+def set_cached_user_weights(user_id: int, weights: Dict[str, float]) -> None:
+    """Stores a user's normalized weights, swallowing Redis errors."""
+    try:
+        cache.set(user_weights_cache_key(user_id), weights, timeout=USER_WEIGHTS_CACHE_TTL)
+    except Exception as e:
+        logger.error(f"Redis persistence failure: {str(e)}")
+
+
+def invalidate_user_weights(user_id: int) -> None:
+    """Drops a user's cached weights after their GoalWeights/Goals change."""
+    try:
+        cache.delete(user_weights_cache_key(user_id))
+    except Exception as e:
+        logger.error(f"Redis invalidation failure: {str(e)}")
@@ -8,34 +8,45 @@ This module contains the Celery task definitions for asynchronous AI scoring.
 Design Principles:
 ------------------
 1. Idempotency: Running the same task twice produces the same result
-2. Atomicity: Database updates are wrapped in transactions
+2. Atomicity: Results are persisted with single-statement UPDATEs
 3. Resilience: Graceful handling of failures with proper retry logic
 4. Observability: Comprehensive logging for production monitoring
 
 Task Flow:
 ----------
 1. Receive (task_id, user_id) from queue
-2. Acquire row lock with select_for_update (prevents race conditions)
+2. Fetch the task (no row lock held across the AI call)
 3. Skip if already processed (idempotency check)
 4. Build user weights from GoalWeights or Goals
 5. Call AIOrchestrator for scoring
-6. Persist results atomically
+6. Persist results with one conditional UPDATE (skips concurrent writes)
 7. Update last_analyzed_at timestamp
+
+Scoring and persistence happen inside the same task, so prioritizing a task
+costs a single broker message; there is no separate finalization task to
+chain or chord onto it.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from celery import shared_task
-from celery.exceptions import MaxRetriesExceededError, SoftTimeLimitExceeded
-from django.db import DatabaseError, IntegrityError, transaction
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from celery import group, shared_task
+from celery.exceptions import MaxRetriesExceededError, Retry, SoftTimeLimitExceeded
+from celery.signals import worker_process_init, worker_process_shutdown
+from celery.utils.time import get_exponential_backoff_interval
+from django.core.signals import setting_changed
+from django.db import DatabaseError, IntegrityError, models
+from django.dispatch import receiver
 
 from goals.models import Goal, GoalWeights
 
 from ..models import Task
+from .cache import get_cached_user_weights, set_cached_user_weights
+from .external_scorer import reset_shared_clients
 from .orchestrator import AIOrchestrator
 
 # ---------------------------------------------------------------------------
@@ -45,46 +56,183 @@ from .orchestrator import AIOrchestrator
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Rows written per UPDATE statement by bulk_update
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Tasks per run_batch_ai_relevance_scoring job when rescoring a whole user
+RESCORE_CHUNK_SIZE = 100
+
+# Tasks analyzed more recently than this are not rescored (idempotency window)
+RECENT_ANALYSIS_SECONDS = 3600
+
+# Scorer error codes for failures that may succeed on a later attempt; any
+# API_ERROR_5xx (server-side error) is treated as transient as well
+TRANSIENT_AI_ERROR_CODES = frozenset({"RATE_LIMIT", "TIMEOUT", "CONNECTION_ERROR"})
+
+# Retry backoff: RETRY_BACKOFF_BASE * 2**retries seconds, capped, full jitter
+RETRY_BACKOFF_BASE = 2
+RETRY_BACKOFF_MAX = 600
+
+# GoalWeights columns that hold domain weights, resolved once at import rather
+# than by walking GoalWeights._meta on every scoring run
+GOAL_WEIGHT_FIELDS: Tuple[str, ...] = tuple(
+    field.name
+    for field in GoalWeights._meta.concrete_fields
+    if isinstance(field, models.FloatField)
+)
+
+# Contract quadrant labels ("Q1".."Q4") to the integer codes stored on Task
+QUADRANT_CODES: Dict[str, int] = {q.label: q.value for q in Task.Quadrant}
+
+# Task columns the scoring tasks read; the rest of the row (rationale,
+# timestamps, previous scores) is never loaded
+SCORING_TASK_FIELDS: Tuple[str, ...] = (
+    "user",
+    "title",
+    "description",
+    "due_date",
+    "effort_estimate",
+    "is_prioritized",
+    "last_analyzed_at",
+)
+
+
+# ---------------------------------------------------------------------------
+# Worker-Level Orchestrator
+# ---------------------------------------------------------------------------
+
+# One orchestrator per worker process, remembered together with the class
+# that built it so a swapped (e.g. patched) AIOrchestrator gets a fresh one
+_orchestrator: Optional[AIOrchestrator] = None
+_orchestrator_factory: Any = None
+_orchestrator_lock = threading.Lock()
+
+
+def _get_orchestrator() -> AIOrchestrator:
+    """
+    Return the process-wide AIOrchestrator, building it on first use.
+
+    Construction reads settings and sets up the rules engine, cache manager
+    and AI client; doing that once per process instead of once per task
+    keeps it off the scoring hot path.
+
+    Returns:
+        The shared AIOrchestrator instance.
+    """
+    global _orchestrator, _orchestrator_factory
+
+    factory = AIOrchestrator
+    orchestrator = _orchestrator
+    if orchestrator is None or _orchestrator_factory is not factory:
+        with _orchestrator_lock:
+            if _orchestrator is None or _orchestrator_factory is not factory:
+                _orchestrator = factory()
+                _orchestrator_factory = factory
+            orchestrator = _orchestrator
+    return orchestrator
+
+
+def reset_orchestrator() -> None:
+    """Drop the shared orchestrator; the next task builds a new one."""
+    global _orchestrator, _orchestrator_factory
+
+    with _orchestrator_lock:
+        _orchestrator = None
+        _orchestrator_factory = None
+
+
+@worker_process_init.connect
+def _build_orchestrator_on_worker_start(**kwargs: Any) -> None:
+    """Build the orchestrator in each prefork child before it takes work."""
+    # Connections inherited from the parent must not be shared across forks
+    reset_shared_clients(close=False)
+    reset_orchestrator()
+    _get_orchestrator()
+
+
+@worker_process_shutdown.connect
+def _close_clients_on_worker_shutdown(**kwargs: Any) -> None:
+    """Close pooled OpenAI connections when a worker child exits."""
+    reset_orchestrator()
+    reset_shared_clients()
+
+
+@receiver(setting_changed)
+def _reset_orchestrator_on_setting_change(setting: str, **kwargs: Any) -> None:
+    """The AI client is configured from OPENAI_API_KEY at construction."""
+    if setting == "OPENAI_API_KEY":
+        reset_orchestrator()
+
+
 # ---------------------------------------------------------------------------
 # Helper Functions
 # ---------------------------------------------------------------------------
 
 
-def _normalize_goal_weights_from_goals(goals_qs) -> Dict[str, float]:
+def _normalize_goal_weights_from_goals(
+    goal_rows: Iterable[Tuple[str, Optional[int]]],
+) -> Dict[str, float]:
     """
-    Derive normalized weights from a queryset of Goal objects.
+    Derive normalized weights from (title, weight) rows of Goal objects.
 
     This is a fallback when GoalWeights is not configured. It takes the
     raw weight values (1-10 scale) from Goals and normalizes them to sum to 1.0.
 
     Args:
-        goals_qs: QuerySet of Goal objects.
+        goal_rows: Iterable of (title, weight) pairs, e.g. from
+                   Goal.objects.values_list("title", "weight").
 
     Returns:
         Dictionary of normalized weights (sum to 1.0), or empty dict if no goals.
     """
-    raw: Dict[str, float] = {}
-
-    for goal in goals_qs:
-        if goal.weight is None:
-            continue
-        # Use slug if available, otherwise title
-        key = getattr(goal, "slug", None) or goal.title
-        raw[str(key)] = float(goal.weight)
+    raw: Dict[str, float] = {
+        str(title): float(weight) for title, weight in goal_rows if weight is not None
+    }
 
-    total = sum(raw.values()) if raw else 0.0
+    total = sum(raw.values())
 
     if total <= 0:
         logger.debug("_normalize_goal_weights_from_goals: No valid weights found")
         return {}
 
-    # Normalize to sum to 1.0
-    normalized = {k: (v / total) for k, v in raw.items()}
+    # Normalize to sum to 1.0 (one division, then a multiply per goal)
+    scale = 1.0 / total
+    normalized = {k: v * scale for k, v in raw.items()}
     logger.debug(f"_normalize_goal_weights_from_goals: Normalized weights = {normalized}")
     return normalized
 
 
-def _get_user_weights(user_id: int) -> Dict[str, float]:
+# Marks "GoalWeights not loaded yet" (None means "loaded, user has none")
+_NOT_FETCHED: Any = object()
+
+
+def _prefetched_goal_weights(task: Task, user_id: int) -> Optional[GoalWeights]:
+    """
+    Return the GoalWeights loaded via select_related("user__goal_weights").
+
+    Args:
+        task: Task fetched with select_related("user__goal_weights").
+        user_id: The user the scoring run is for.
+
+    Returns:
+        The user's GoalWeights, None if the user has not configured any, or
+        _NOT_FETCHED if the task belongs to someone else.
+    """
+    if task.user_id != user_id:
+        return _NOT_FETCHED
+    try:
+        return task.user.goal_weights
+    except GoalWeights.DoesNotExist:
+        return None
+
+
+def _get_user_weights(
+    user_id: int, goal_weights: Optional[GoalWeights] = _NOT_FETCHED
+) -> Dict[str, float]:
     """
     Retrieve user's strategic weights for importance calculation.
 
@@ -93,28 +241,67 @@ def _get_user_weights(user_id: int) -> Dict[str, float]:
     2. Goals model (derived from goal weights)
     3. Default equal weights (fallback)
 
+    A GoalWeights row loaded with the task is used as-is. Otherwise the
+    per-user weights cache is consulted before touching the database, and
+    refilled on a miss.
+
     Args:
         user_id: The user's ID.
+        goal_weights: The user's GoalWeights (or None if they have none) when
+                      already loaded with the task; queried if omitted.
 
     Returns:
         Dictionary of domain weights (always sums to 1.0).
     """
-    # Try GoalWeights first (preferred source)
-    goal_weights = GoalWeights.objects.filter(user_id=user_id).first()
-
-    if goal_weights:
-        weights = {
-            "work_bills": float(goal_weights.work_bills),
-            "study": float(goal_weights.study),
-            "health": float(goal_weights.health),
-            "relationships": float(goal_weights.relationships),
-        }
+    if goal_weights is _NOT_FETCHED or goal_weights is None:
+        cached = get_cached_user_weights(user_id)
+        if cached is not None:
+            logger.debug(f"_get_user_weights: Using cached weights for user {user_id}")
+            return cached
+
+        weights = _load_user_weights(user_id, goal_weights)
+        set_cached_user_weights(user_id, weights)
+        return weights
+
+    return _load_user_weights(user_id, goal_weights)
+
+
+def _load_user_weights(
+    user_id: int, goal_weights: Optional[GoalWeights] = _NOT_FETCHED
+) -> Dict[str, float]:
+    """
+    Build a user's weights from the database (see _get_user_weights).
+
+    Args:
+        user_id: The user's ID.
+        goal_weights: Preloaded GoalWeights or None; queried if omitted.
+
+    Returns:
+        Dictionary of domain weights (always sums to 1.0).
+    """
+    # Try GoalWeights first (preferred source); when not preloaded, read just
+    # the weight columns as a tuple instead of building a model instance
+    if goal_weights is _NOT_FETCHED:
+        row = (
+            GoalWeights.objects.filter(user_id=user_id)
+            .values_list(*GOAL_WEIGHT_FIELDS)
+            .first()
+        )
+    elif goal_weights is not None:
+        row = tuple(getattr(goal_weights, name) for name in GOAL_WEIGHT_FIELDS)
+    else:
+        row = None
+
+    if row is not None:
+        weights = {name: float(value) for name, value in zip(GOAL_WEIGHT_FIELDS, row)}
         logger.debug(f"_get_user_weights: Using GoalWeights for user {user_id}")
         return weights
 
-    # Fallback: derive from Goals
-    user_goals = Goal.objects.filter(user_id=user_id, is_archived=False)
-    derived_weights = _normalize_goal_weights_from_goals(user_goals)
+    # Fallback: derive from Goals (projected rows, no model instances)
+    goal_rows = Goal.objects.filter(user_id=user_id, is_archived=False).values_list(
+        "title", "weight"
+    )
+    derived_weights = _normalize_goal_weights_from_goals(goal_rows)
 
     if derived_weights:
         logger.debug(f"_get_user_weights: Using derived weights for user {user_id}")
@@ -125,15 +312,10 @@ def _get_user_weights(user_id: int) -> Dict[str, float]:
         f"_get_user_weights: Using default equal weights for user {user_id} "
         "(no GoalWeights or Goals found)"
     )
-    return {
-        "work_bills": 0.25,
-        "study": 0.25,
-        "health": 0.25,
-        "relationships": 0.25,
-    }
+    return dict.fromkeys(GOAL_WEIGHT_FIELDS, 1.0 / len(GOAL_WEIGHT_FIELDS))
 
 
-def _should_skip_scoring(task: Task) -> bool:
+def _should_skip_scoring(task: Task, now: Optional[datetime] = None) -> bool:
     """
     Check if a task should skip scoring (idempotency check).
 
@@ -142,10 +324,14 @@ def _should_skip_scoring(task: Task) -> bool:
     - It was analyzed recently (within the last hour)
 
     This prevents redundant processing during retries while still
-    allowing re-scoring if the task was updated.
+    allowing re-scoring if the task was updated. The scoring task applies
+    the same rule in SQL (see _recently_analyzed) so skipped rows are never
+    loaded; this helper checks an already-loaded instance.
 
     Args:
         task: The Task instance to check.
+        now: Reference time; callers checking many tasks pass one value
+             instead of reading the clock per task. Defaults to the current time.
 
     Returns:
         True if scoring should be skipped, False otherwise.
@@ -155,8 +341,9 @@ def _should_skip_scoring(task: Task) -> bool:
 
     # Check if analyzed recently (prevents retry loops)
     if hasattr(task, "last_analyzed_at") and task.last_analyzed_at:
-        age_seconds = (datetime.now(timezone.utc) - task.last_analyzed_at).total_seconds()
-        if age_seconds < 3600:  # Within last hour
+        now = now or datetime.now(timezone.utc)
+        age_seconds = (now - task.last_analyzed_at).total_seconds()
+        if age_seconds < RECENT_ANALYSIS_SECONDS:
             logger.info(
                 f"Task {task.id} already analyzed {age_seconds:.0f}s ago, skipping"
             )
@@ -165,6 +352,88 @@ def _should_skip_scoring(task: Task) -> bool:
     return False
 
 
+def _recently_analyzed(now: datetime) -> models.Q:
+    """
+    Filter matching tasks that _should_skip_scoring would skip.
+
+    Args:
+        now: Reference time for the idempotency window.
+
+    Returns:
+        Q object selecting prioritized tasks analyzed within the window.
+    """
+    return models.Q(
+        is_prioritized=True,
+        last_analyzed_at__gte=now - timedelta(seconds=RECENT_ANALYSIS_SECONDS),
+    )
+
+
+def _is_transient_failure(result: Dict[str, Any]) -> bool:
+    """
+    Check whether a decision contract records a retryable AI failure.
+
+    The scorer catches OpenAI/network exceptions and reports them through the
+    contract's error_code, so retries key off that code rather than an exception.
+
+    Args:
+        result: Decision contract returned by the AIOrchestrator.
+
+    Returns:
+        True for rate limits, timeouts, connection and 5xx errors.
+    """
+    error_code = result.get("error_code") or ""
+    return error_code in TRANSIENT_AI_ERROR_CODES or error_code.startswith(
+        "API_ERROR_5"
+    )
+
+
+def _retry_countdown(retries: int) -> int:
+    """
+    Seconds to wait before the next retry (exponential, full jitter).
+
+    Args:
+        retries: Number of retries already attempted.
+
+    Returns:
+        Countdown in seconds, at most RETRY_BACKOFF_MAX.
+    """
+    return get_exponential_backoff_interval(
+        factor=RETRY_BACKOFF_BASE,
+        retries=retries,
+        maximum=RETRY_BACKOFF_MAX,
+        full_jitter=True,
+    )
+
+
+def _contract_update_fields(
+    result: Dict[str, Any], analyzed_at: datetime
+) -> Dict[str, Any]:
+    """
+    Map an orchestrator decision contract to Task field values.
+
+    Args:
+        result: Decision contract returned by the AIOrchestrator.
+        analyzed_at: Timestamp to record as last_analyzed_at.
+
+    Returns:
+        Dictionary of Task field names to persisted values.
+    """
+    update_fields: Dict[str, Any] = {
+        "importance_score": result.get("importance_score", 0.0),
+        "urgency_score": result.get("urgency_score", 0.0),
+        "quadrant": QUADRANT_CODES.get(result.get("quadrant")),
+        "rationale": result.get("rationale", "") or "",
+        "priority_score": result.get("importance_score", 0.0),
+        "is_prioritized": True,
+    }
+
+    # Update last_analyzed_at if the field exists
+    if hasattr(Task, "last_analyzed_at"):
+        update_fields["last_analyzed_at"] = analyzed_at
+
+    return update_fields
+
+
 # ---------------------------------------------------------------------------
 # Main Celery Task
 # ---------------------------------------------------------------------------
@@ -195,8 +464,9 @@ def run_ai_relevance_scoring(
     scores via the AIOrchestrator, and persists the results atomically.
 
     Idempotency:
-    - Uses select_for_update to prevent race conditions
     - Checks is_prioritized flag to skip already-processed tasks
+    - Persists with one conditional UPDATE that refuses to overwrite a
+      result written concurrently (no row lock held across the AI call)
     - Updates last_analyzed_at for audit trail
 
     Error Handling:
@@ -221,99 +491,126 @@ def run_ai_relevance_scoring(
 
     try:
         # ─────────────────────────────────────────────────────────────────────
-        # STEP 1: Acquire lock and fetch task
+        # STEP 1: Fetch task (ownership and idempotency checked in SQL)
         # ─────────────────────────────────────────────────────────────────────
-        with transaction.atomic():
-            # select_for_update prevents concurrent modifications
-            task = (
-                Task.objects.select_for_update(nowait=False)
-                .filter(id=task_id)
-                .first()
+        # No row lock: it would be held for the whole AI round-trip. Concurrent
+        # writers are resolved by the conditional UPDATE in STEP 5 instead.
+        # The user's GoalWeights ride along in the same query (see STEP 3);
+        # only the columns used below are selected.
+        fetch = (
+            Task.objects.select_related("user__goal_weights")
+            .only(
+                *SCORING_TASK_FIELDS,
+                "user__id",
+                *(f"user__goal_weights__{name}" for name in GOAL_WEIGHT_FIELDS),
             )
+            .filter(id=task_id, user_id=user_id)
+        )
+        if not force_rescore:
+            fetch = fetch.exclude(_recently_analyzed(datetime.now(timezone.utc)))
+        task = fetch.first()
 
-            if not task:
+        # ─────────────────────────────────────────────────────────────────────
+        # STEP 2: Explain a miss with a single-column lookup
+        # ─────────────────────────────────────────────────────────────────────
+        if task is None:
+            owner_id = (
+                Task.objects.filter(id=task_id).values_list("user_id", flat=True).first()
+            )
+            if owner_id is None:
                 logger.warning(f"[{correlation_id}] Task {task_id} not found, exiting")
                 return None
 
-            # Verify ownership
-            if task.user_id != user_id:
+            if owner_id != user_id:
                 logger.error(
-                    f"[{correlation_id}] Task {task_id} belongs to user {task.user_id}, "
+                    f"[{correlation_id}] Task {task_id} belongs to user {owner_id}, "
                     f"not {user_id}. Aborting."
                 )
                 return None
 
-            # ─────────────────────────────────────────────────────────────────
-            # STEP 2: Idempotency check
-            # ─────────────────────────────────────────────────────────────────
-            if not force_rescore and _should_skip_scoring(task):
+            logger.info(
+                f"[{correlation_id}] Task already processed, skipping "
+                f"(use force_rescore=True to override)"
+            )
+            return {
+                "status": "skipped",
+                "reason": "already_processed",
+                "task_id": task_id,
+            }
+
+        # ─────────────────────────────────────────────────────────────────────
+        # STEP 3: Build user weights
+        # ─────────────────────────────────────────────────────────────────────
+        user_weights = _get_user_weights(
+            user_id, goal_weights=_prefetched_goal_weights(task, user_id)
+        )
+        logger.debug(f"[{correlation_id}] User weights: {user_weights}")
+
+        # ─────────────────────────────────────────────────────────────────────
+        # STEP 4: Run orchestrator
+        # ─────────────────────────────────────────────────────────────────────
+        orchestrator = _get_orchestrator()
+
+        result = orchestrator.get_relevance_scores(
+            task_title=task.title,
+            task_description=task.description or "",
+            user_weights=user_weights,
+            due_date=(task.due_date.isoformat() if task.due_date else None),
+            effort_estimate=(
+                int(task.effort_estimate) if task.effort_estimate is not None else None
+            ),
+        )
+
+        logger.debug(f"[{correlation_id}] Orchestrator result: {result}")
+
+        if _is_transient_failure(result) and self.request.retries < self.max_retries:
+            # Leave the task untouched so a successful retry isn't blocked by a
+            # freshly persisted fallback (which the idempotency window would keep)
+            countdown = _retry_countdown(self.request.retries)
+            logger.warning(
+                f"[{correlation_id}] Transient AI failure "
+                f"({result.get('error_code')}), retrying in {countdown}s"
+            )
+            raise self.retry(countdown=countdown)
+
+        # ─────────────────────────────────────────────────────────────────────
+        # STEP 5: Persist results with a single conditional UPDATE
+        # ─────────────────────────────────────────────────────────────────────
+        now = datetime.now(timezone.utc)
+        update_fields = _contract_update_fields(result, now)
+
+        target = Task.objects.filter(id=task_id, user_id=user_id)
+        if not force_rescore:
+            # Idempotency guard: don't overwrite a result that another worker
+            # persisted while this one was waiting on the AI
+            target = target.exclude(_recently_analyzed(now))
+        rows_updated = target.update(**update_fields)
+
+        if rows_updated == 0:
+            if Task.objects.filter(id=task_id).exists():
                 logger.info(
-                    f"[{correlation_id}] Task already processed, skipping "
-                    f"(use force_rescore=True to override)"
+                    f"[{correlation_id}] Task {task_id} was scored concurrently, "
+                    "keeping the existing result"
                 )
                 return {
                     "status": "skipped",
                     "reason": "already_processed",
                     "task_id": task_id,
                 }
-
-            # ─────────────────────────────────────────────────────────────────
-            # STEP 3: Build user weights
-            # ─────────────────────────────────────────────────────────────────
-            user_weights = _get_user_weights(user_id)
-            logger.debug(f"[{correlation_id}] User weights: {user_weights}")
-
-            # ─────────────────────────────────────────────────────────────────
-            # STEP 4: Run orchestrator
-            # ─────────────────────────────────────────────────────────────────
-            orchestrator = AIOrchestrator()
-
-            result = orchestrator.get_relevance_scores(
-                task_title=task.title,
-                task_description=task.description or "",
-                user_weights=user_weights,
-                due_date=(task.due_date.isoformat() if task.due_date else None),
-                effort_estimate=(
-                    int(task.effort_estimate) if task.effort_estimate is not None else None
-                ),
+            logger.error(
+                f"[{correlation_id}] Failed to update task {task_id} - "
+                "no rows affected"
             )
+            return None
 
-            logger.debug(f"[{correlation_id}] Orchestrator result: {result}")
-
-            # ─────────────────────────────────────────────────────────────────
-            # STEP 5: Persist results atomically
-            # ─────────────────────────────────────────────────────────────────
-            update_fields: Dict[str, Any] = {
-                "importance_score": result.get("importance_score", 0.0),
-                "urgency_score": result.get("urgency_score", 0.0),
-                "quadrant": result.get("quadrant"),
-                "rationale": result.get("rationale", "") or "",
-                "priority_score": result.get("importance_score", 0.0),
-                "is_prioritized": True,
-            }
-
-            # Update last_analyzed_at if the field exists
-            if hasattr(Task, "last_analyzed_at"):
-                update_fields["last_analyzed_at"] = datetime.now(timezone.utc)
-
-            # Atomic update using .update() for idempotency
-            rows_updated = Task.objects.filter(id=task_id).update(**update_fields)
-
-            if rows_updated == 0:
-                logger.error(
-                    f"[{correlation_id}] Failed to update task {task_id} - "
-                    "no rows affected"
-                )
-                return None
-
-            logger.info(
-                f"[{correlation_id}] AI scoring completed successfully - "
-                f"quadrant={result.get('quadrant')}, "
-                f"importance={result.get('importance_score', 0):.2f}, "
-                f"method={result.get('scoring_method')}"
-            )
+        logger.info(
+            f"[{correlation_id}] AI scoring completed successfully - "
+            f"quadrant={result.get('quadrant')}, "
+            f"importance={result.get('importance_score', 0):.2f}, "
+            f"method={result.get('scoring_method')}"
+        )
 
-            return result
+        return result
 
     except SoftTimeLimitExceeded:
         logger.error(
@@ -326,6 +623,9 @@ def run_ai_relevance_scoring(
         )
         raise  # Let Celery handle the retry
 
+    except Retry:
+        raise  # Retry scheduled above, not an error
+
     except MaxRetriesExceededError:
         logger.error(
             f"[{correlation_id}] Max retries exceeded, marking task as failed"
@@ -334,7 +634,7 @@ def run_ai_relevance_scoring(
         Task.objects.filter(id=task_id).update(
             is_prioritized=False,
             rationale="Scoring failed after maximum retries",
-            quadrant="Q4",  # Default to lowest priority
+            quadrant=Task.Quadrant.Q4,  # Default to lowest priority
         )
         return None
 
@@ -362,11 +662,102 @@ def run_ai_relevance_scoring(
 
         # Re-raise for Celery retry if retries remain
         if self.request.retries < self.max_retries:
-            raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+            raise self.retry(
+                exc=exc, countdown=_retry_countdown(self.request.retries)
+            )
 
         return None
 
 
+@shared_task(
+    bind=True,
+    name="tasks.ai_engine.run_batch_ai_relevance_scoring",
+    autoretry_for=(DatabaseError, IntegrityError),
+    retry_backoff=True,
+    retry_backoff_max=600,  # Max backoff of 10 minutes
+    max_retries=3,
+    time_limit=180,  # One AI call per chunk of tasks, so allow longer than single
+    soft_time_limit=170,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def run_batch_ai_relevance_scoring(
+    self,
+    task_ids: List[int],
+    user_id: int,
+) -> Dict[str, Any]:
+    """
+    Celery worker task that scores several of one user's tasks together.
+
+    Instead of one AI round-trip per task, the AIOrchestrator resolves all
+    cache lookups at once and sends every cache miss in a single batch
+    prompt. Results are written back with one bulk_update.
+
+    Unlike run_ai_relevance_scoring this always rescores (no idempotency
+    skip) and takes no row locks: it is meant for bulk rescoring, where
+    the last writer winning is acceptable.
+
+    Args:
+        self: Celery task instance (for retry access).
+        task_ids: Primary keys of the Tasks to score.
+        user_id: Primary key of the User who owns the tasks.
+
+    Returns:
+        Summary with counts of scored and skipped tasks.
+    """
+    correlation_id = f"batch-user-{user_id}-attempt-{self.request.retries}"
+    logger.info(f"[{correlation_id}] Batch AI scoring started for {len(task_ids)} tasks")
+
+    # Ownership is enforced by the user_id filter; foreign ids are skipped
+    tasks = list(
+        Task.objects.filter(id__in=task_ids, user_id=user_id).only(*SCORING_TASK_FIELDS)
+    )
+
+    if tasks:
+        user_weights = _get_user_weights(user_id)
+        orchestrator = _get_orchestrator()
+
+        results = orchestrator.get_relevance_scores_batch(
+            [
+                {
+                    "id": task.id,
+                    "title": task.title,
+                    "description": task.description or "",
+                    "due_date": task.due_date.isoformat() if task.due_date else None,
+                    "effort_estimate": (
+                        int(task.effort_estimate)
+                        if task.effort_estimate is not None
+                        else None
+                    ),
+                }
+                for task in tasks
+            ],
+            user_weights,
+        )
+
+        analyzed_at = datetime.now(timezone.utc)
+        rows = [
+            (task, _contract_update_fields(results[task.id], analyzed_at))
+            for task in tasks
+        ]
+        for task, values in rows:
+            for field, value in values.items():
+                setattr(task, field, value)
+
+        # Every row carries the same field set; write them all in one pass
+        Task.objects.bulk_update(
+            tasks, list(rows[0][1]), batch_size=BULK_UPDATE_BATCH_SIZE
+        )
+
+    summary = {
+        "scored": len(tasks),
+        "skipped": len(task_ids) - len(tasks),
+        "total": len(task_ids),
+    }
+    logger.info(f"[{correlation_id}] Batch AI scoring completed: {summary}")
+    return summary
+
+
 # ---------------------------------------------------------------------------
 # Utility Tasks
 # ---------------------------------------------------------------------------
@@ -386,24 +777,40 @@ def bulk_rescore_tasks(task_ids: List[int], user_id: int) -> Dict[str, Any]:
     Returns:
         Summary of queued tasks.
     """
-    queued = 0
-    skipped = 0
+    # Verify ownership for every id in one query, without loading the rows
+    owned_ids = set(
+        Task.objects.filter(id__in=task_ids, user_id=user_id).values_list("id", flat=True)
+    )
 
+    signatures = []
     for task_id in task_ids:
+        if task_id in owned_ids:
+            signatures.append(
+                run_ai_relevance_scoring.s(task_id, user_id, force_rescore=True)
+            )
+        else:
+            logger.warning(
+                f"bulk_rescore_tasks: Task {task_id} not found or "
+                f"doesn't belong to user {user_id}"
+            )
+
+    queued = 0
+    if signatures:
+        # Rescoring usually follows a weights change, which invalidated the
+        # cached weights; load them once here so the whole burst of workers
+        # hits the cache instead of each one querying GoalWeights
+        _get_user_weights(user_id)
+
+        # One group publishes every message over a single producer
+        # connection instead of acquiring one per delay() call
         try:
-            # Verify task belongs to user before queueing
-            if Task.objects.filter(id=task_id, user_id=user_id).exists():
-                run_ai_relevance_scoring.delay(task_id, user_id, force_rescore=True)
-                queued += 1
-            else:
-                skipped += 1
-                logger.warning(
-                    f"bulk_rescore_tasks: Task {task_id} not found or "
-                    f"doesn't belong to user {user_id}"
-                )
+            group(signatures).apply_async()
+            queued = len(signatures)
         except Exception as e:
-            logger.error(f"bulk_rescore_tasks: Failed to queue task {task_id}: {e}")
-            skipped += 1
+            logger.error(
+                f"bulk_rescore_tasks: Failed to queue {len(signatures)} tasks: {e}"
+            )
+    skipped = len(task_ids) - queued
 
     logger.info(
         f"bulk_rescore_tasks: Queued {queued} tasks, skipped {skipped}"
@@ -414,3 +821,44 @@ def bulk_rescore_tasks(task_ids: List[int], user_id: int) -> Dict[str, Any]:
         "skipped": skipped,
         "total": len(task_ids),
     }
+
+
+@shared_task(name="tasks.ai_engine.rescore_user_tasks")
+def rescore_user_tasks(user_id: int) -> Dict[str, Any]:
+    """
+    Queue every open task of a user for batch rescoring.
+
+    Meant for after a weights change: the tasks are split into chunks of
+    RESCORE_CHUNK_SIZE, each scored by one run_batch_ai_relevance_scoring
+    job (batched AI prompts, one bulk_update), and all jobs are published
+    as a single group.
+
+    Args:
+        user_id: User whose tasks should be rescored.
+
+    Returns:
+        Summary with the number of tasks and batch jobs queued.
+    """
+    task_ids = list(
+        Task.objects.filter(user_id=user_id, is_completed=False)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    chunks = [
+        task_ids[start:start + RESCORE_CHUNK_SIZE]
+        for start in range(0, len(task_ids), RESCORE_CHUNK_SIZE)
+    ]
+
+    if chunks:
+        # One weights load for every job in the burst (see bulk_rescore_tasks)
+        _get_user_weights(user_id)
+        group(
+            [run_batch_ai_relevance_scoring.s(chunk, user_id) for chunk in chunks]
+        ).apply_async()
+
+    logger.info(
+        f"rescore_user_tasks: Queued {len(task_ids)} tasks in {len(chunks)} "
+        f"batches for user {user_id}"
+    )
+
+    return {"queued": len(task_ids), "batches": len(chunks)}
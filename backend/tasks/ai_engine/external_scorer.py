@@ -26,7 +26,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.conf import settings
 
@@ -69,6 +72,31 @@ except ImportError:
     PermissionDeniedError = Exception  # type: ignore
     UnprocessableEntityError = Exception  # type: ignore
 
+# Optional C-accelerated decoder for AI responses
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+
+def _json_loads(raw: str) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    orjson is strict RFC 8259 and rejects the NaN/Infinity literals that
+    models occasionally emit; those documents are retried with the stdlib
+    decoder so they are still accepted (and then clamped by _clean_scores).
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(raw)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +118,155 @@ class ScorerUnavailableError(Exception):
     pass
 
 
+# ---------------------------------------------------------------------------
+# Shared Client & Prompt Caches
+# ---------------------------------------------------------------------------
+
+# Static part of the system prompt; only the schema example varies by domains
+SYSTEM_PROMPT_RULES: str = (
+    "You are a strict strategic categorization engine. "
+    "Your ONLY job is to score how well a task aligns with specific life domains.\n\n"
+    "RULES:\n"
+    "1. Ignore urgency, deadlines, or emotional language.\n"
+    "2. Score alignment purely on semantic relevance (0.0 = Irrelevant, 1.0 = Highly Relevant).\n"
+    "3. Normalize all scores to be between 0.0 and 1.0.\n"
+    "4. Return ONLY valid JSON. No markdown, no commentary.\n"
+)
+
+# OpenAI clients keyed by (factory, api_key, client kwargs), reused across
+# scorer instances so each one does not pay for its own connection pool/TLS.
+_shared_clients: Dict[Tuple[Any, ...], Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(api_key: str, **client_kwargs: Any) -> Any:
+    """
+    Return a process-wide OpenAI client for the given configuration.
+
+    Args:
+        api_key: OpenAI API key.
+        **client_kwargs: Additional keyword arguments for the OpenAI client.
+
+    Returns:
+        An OpenAI client, created on first use and reused afterwards.
+    """
+    key = (OpenAI, api_key, tuple(sorted(client_kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable client options: build a dedicated client
+        return OpenAI(api_key=api_key, **client_kwargs)
+
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = OpenAI(api_key=api_key, **client_kwargs)
+                _shared_clients[key] = client
+    return client
+
+
+def reset_shared_clients(close: bool = True) -> None:
+    """
+    Forget the process-wide OpenAI clients.
+
+    Args:
+        close: Close each client's connection pool. Pass False in a freshly
+               forked child: the pool's sockets belong to the parent, so the
+               child must drop its copies without shutting them down.
+    """
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+
+    if not close:
+        return
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"ExternalAIScorer: Failed to close OpenAI client: {e}")
+
+
+@lru_cache(maxsize=128)
+def _system_prompt_for(domains: Tuple[str, ...]) -> str:
+    """
+    Build (once per domain tuple) the system prompt with its JSON schema example.
+
+    Args:
+        domains: Domain names to score against, in prompt order.
+
+    Returns:
+        The complete system prompt string.
+    """
+    json_structure_example = json.dumps(
+        {"relevance_scores": {domain: 0.5 for domain in domains}, "confidence": 0.9}
+    )
+    return (
+        SYSTEM_PROMPT_RULES
+        + f"5. The output must strictly follow this schema: {json_structure_example}"
+    )
+
+
+@lru_cache(maxsize=128)
+def _batch_system_prompt_for(domains: Tuple[str, ...]) -> str:
+    """
+    Build (once per domain tuple) the system prompt for multi-task scoring.
+
+    Args:
+        domains: Domain names to score against, in prompt order.
+
+    Returns:
+        The complete batch system prompt string.
+    """
+    json_structure_example = json.dumps(
+        {
+            "<task id>": {
+                "relevance_scores": {domain: 0.5 for domain in domains},
+                "confidence": 0.9,
+            }
+        }
+    )
+    return (
+        SYSTEM_PROMPT_RULES
+        + "5. Score every task in the list independently.\n"
+        + "6. Return one JSON object keyed by task id (as a string), strictly "
+        + f"following this schema: {json_structure_example}"
+    )
+
+
+@lru_cache(maxsize=128)
+def _domains_instruction_for(domains: Tuple[str, ...]) -> str:
+    """
+    Build (once per domain tuple) the closing line of every user message.
+
+    Args:
+        domains: Domain names to score against, in prompt order.
+
+    Returns:
+        The "Score alignment for these domains: ..." line.
+    """
+    return f"Score alignment for these domains: {', '.join(domains)}"
+
+
+def _unit_interval(value: Any) -> float:
+    """
+    Coerce one AI-supplied number to a float clamped to [0.0, 1.0].
+
+    Non-numeric values and NaN map to 0.0.
+    """
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+    # `not >=` also catches NaN, which compares false to everything
+    if not number >= 0.0:
+        return 0.0
+    return number if number <= 1.0 else 1.0
+
+
 # ---------------------------------------------------------------------------
 # Main Service Class
 # ---------------------------------------------------------------------------
@@ -130,6 +307,12 @@ class ExternalAIScorer:
     DEFAULT_MAX_TOKENS: int = 200
     DEFAULT_TIMEOUT: float = 10.0  # Seconds
 
+    # Maximum number of tasks sent in a single batch prompt
+    MAX_BATCH_SIZE: int = 20
+
+    # Upper bound on Chat Completions in flight at once from one worker
+    MAX_CONCURRENT_REQUESTS: int = 16
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -193,7 +376,7 @@ class ExternalAIScorer:
         # Check 3: Can we initialize the client?
         try:
             self.api_key = resolved_key
-            self.client = OpenAI(api_key=self.api_key, **self._client_kwargs)
+            self.client = _get_shared_client(self.api_key, **self._client_kwargs)
             self.is_configured = True
             self.configuration_error = None
             logger.info(
@@ -289,78 +472,216 @@ class ExternalAIScorer:
 
             return result
 
+        except Exception as e:
+            return self._get_exception_response(e, domains)
+
+    def score_tasks_batch(
+        self,
+        tasks: List[Tuple[int, str, str]],
+        user_weights: Dict[str, float],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Score several tasks against the same domains in one Chat Completion.
+
+        Amortizes the network round-trip and prompt header tokens across the
+        batch. Tasks are sent in chunks of at most MAX_BATCH_SIZE per call;
+        when there are several chunks they are sent concurrently (at most
+        MAX_CONCURRENT_REQUESTS at a time) over the shared client, so every
+        chunk reuses the process's pooled connections.
+
+        Args:
+            tasks: List of (task_id, task_title, task_description) tuples.
+            user_weights: Dictionary whose keys define the domains (values
+                          are ignored, as in score_task).
+
+        Returns:
+            Dictionary mapping each task_id to the same contract that
+            score_task returns. Tasks missing from the AI response get an
+            error response with error_code "MISSING_RESULT".
+        """
+        domains: List[str] = list(user_weights.keys())
+
+        if not self.is_configured or self.client is None:
+            logger.warning(
+                f"ExternalAIScorer.score_tasks_batch called but scorer not configured. "
+                f"Reason: {self.configuration_error}"
+            )
+            error = self._get_error_response(
+                domains,
+                error_code="SCORER_NOT_CONFIGURED",
+                error_message=self.configuration_error or "Scorer not available",
+            )
+            return {task_id: dict(error) for task_id, _, _ in tasks}
+
+        chunks = [
+            tasks[start:start + self.MAX_BATCH_SIZE]
+            for start in range(0, len(tasks), self.MAX_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            return self._score_chunk(chunks[0], domains)
+
+        results: Dict[int, Dict[str, Any]] = {}
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for chunk_result in executor.map(
+                lambda chunk: self._score_chunk(chunk, domains), chunks
+            ):
+                results.update(chunk_result)
+        return results
+
+    def _score_chunk(
+        self,
+        tasks: List[Tuple[int, str, str]],
+        domains: List[str],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Issue one Chat Completion for a chunk of tasks (see score_tasks_batch)."""
+        task_ids = [task_id for task_id, _, _ in tasks]
+
+        try:
+            response = self.client.chat.completions.create(
+                **self._chunk_request(tasks, domains)
+            )
+            return self._parse_chunk_response(response, task_ids, domains)
+
+        except Exception as e:
+            error = self._get_exception_response(e, domains)
+            return {task_id: dict(error) for task_id in task_ids}
+
+    def _chunk_request(
+        self,
+        tasks: List[Tuple[int, str, str]],
+        domains: List[str],
+    ) -> Dict[str, Any]:
+        """Build the Chat Completion arguments for one batch chunk."""
+        logger.debug(
+            f"ExternalAIScorer: Batch scoring {len(tasks)} tasks against domains: {domains}"
+        )
+        return {
+            "model": self.model,
+            "messages": self._build_batch_messages(tasks, domains),
+            "temperature": self.DEFAULT_TEMPERATURE,
+            "max_tokens": self.DEFAULT_MAX_TOKENS * len(tasks),
+            "response_format": {"type": "json_object"},
+            "timeout": self.timeout,
+        }
+
+    def _parse_chunk_response(
+        self,
+        response: Any,
+        task_ids: List[int],
+        domains: List[str],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Split a batch completion into per-task contracts.
+
+        Raises:
+            ValueError: If the response is empty or not a JSON object.
+        """
+        raw_content: str = response.choices[0].message.content or ""
+        if not raw_content:
+            raise ValueError("Empty response from AI")
+
+        data = _json_loads(raw_content)
+        if not isinstance(data, dict):
+            raise ValueError("Batch response must be a JSON object keyed by task id")
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for task_id in task_ids:
+            entry = data.get(str(task_id))
+            try:
+                results[task_id] = self._clean_scores(entry, domains)
+            except ValueError as e:
+                results[task_id] = self._get_error_response(
+                    domains, error_code="MISSING_RESULT", error_message=str(e)
+                )
+
+        logger.info(f"ExternalAIScorer: Batch scored {len(task_ids)} tasks")
+        return results
+
+    def _get_exception_response(
+        self, exc: Exception, domains: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Map an exception raised while calling/parsing the API to an error response.
+
+        Args:
+            exc: The exception that was raised.
+            domains: List of domain names.
+
+        Returns:
+            Dictionary with fallback scores and an error code for the failure.
+        """
         # Handle specific OpenAI errors with appropriate error codes
-        except AuthenticationError as e:
-            logger.error(f"OpenAI authentication failed: {e}")
+        if isinstance(exc, AuthenticationError):
+            logger.error(f"OpenAI authentication failed: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="AUTH_ERROR",
                 error_message="Invalid API key or authentication failed",
             )
 
-        except RateLimitError as e:
-            logger.warning(f"OpenAI rate limit exceeded: {e}")
+        if isinstance(exc, RateLimitError):
+            logger.warning(f"OpenAI rate limit exceeded: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="RATE_LIMIT",
                 error_message="API rate limit exceeded, please retry later",
             )
 
-        except APITimeoutError as e:
-            logger.warning(f"OpenAI API timeout: {e}")
+        if isinstance(exc, APITimeoutError):
+            logger.warning(f"OpenAI API timeout: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="TIMEOUT",
                 error_message="API request timed out",
             )
 
-        except APIConnectionError as e:
-            logger.error(f"OpenAI connection error: {e}")
+        if isinstance(exc, APIConnectionError):
+            logger.error(f"OpenAI connection error: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="CONNECTION_ERROR",
                 error_message="Could not connect to OpenAI API",
             )
 
-        except BadRequestError as e:
-            logger.error(f"OpenAI bad request: {e}")
+        if isinstance(exc, BadRequestError):
+            logger.error(f"OpenAI bad request: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="BAD_REQUEST",
                 error_message="Invalid request to OpenAI API",
             )
 
-        except APIStatusError as e:
-            logger.error(f"OpenAI API status error: {e.status_code} - {e}")
+        if isinstance(exc, APIStatusError):
+            logger.error(f"OpenAI API status error: {exc.status_code} - {exc}")
             return self._get_error_response(
                 domains,
-                error_code=f"API_ERROR_{e.status_code}",
-                error_message=f"OpenAI API error (status {e.status_code})",
+                error_code=f"API_ERROR_{exc.status_code}",
+                error_message=f"OpenAI API error (status {exc.status_code})",
             )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to decode AI response as JSON: {e}")
+        if isinstance(exc, json.JSONDecodeError):
+            logger.error(f"Failed to decode AI response as JSON: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="JSON_PARSE_ERROR",
                 error_message="AI returned invalid JSON response",
             )
 
-        except ValueError as e:
-            logger.error(f"Response validation failed: {e}")
+        if isinstance(exc, ValueError):
+            logger.error(f"Response validation failed: {exc}")
             return self._get_error_response(
                 domains,
                 error_code="VALIDATION_ERROR",
-                error_message=str(e),
+                error_message=str(exc),
             )
 
-        except Exception as e:
-            logger.exception(f"Unexpected error in ExternalAIScorer: {e}")
-            return self._get_error_response(
-                domains,
-                error_code="UNEXPECTED_ERROR",
-                error_message=f"Unexpected error: {type(e).__name__}",
-            )
+        logger.exception(f"Unexpected error in ExternalAIScorer: {exc}")
+        return self._get_error_response(
+            domains,
+            error_code="UNEXPECTED_ERROR",
+            error_message=f"Unexpected error: {type(exc).__name__}",
+        )
 
     def _build_messages(
         self, title: str, description: str, domains: List[str]
@@ -381,30 +702,45 @@ class ExternalAIScorer:
         Returns:
             List of message dictionaries for the Chat Completions API.
         """
-        # Define the expected JSON schema in the prompt
-        json_structure_example = json.dumps(
-            {"relevance_scores": {domain: 0.5 for domain in domains}, "confidence": 0.9}
-        )
-
-        system_prompt = (
-            "You are a strict strategic categorization engine. "
-            "Your ONLY job is to score how well a task aligns with specific life domains.\n\n"
-            "RULES:\n"
-            "1. Ignore urgency, deadlines, or emotional language.\n"
-            "2. Score alignment purely on semantic relevance (0.0 = Irrelevant, 1.0 = Highly Relevant).\n"
-            "3. Normalize all scores to be between 0.0 and 1.0.\n"
-            "4. Return ONLY valid JSON. No markdown, no commentary.\n"
-            f"5. The output must strictly follow this schema: {json_structure_example}"
-        )
+        # Everything but the task text is cached per domain tuple
+        domain_key = tuple(domains)
 
         user_content = (
             f"Task Title: {title}\n"
             f"Task Description: {description}\n\n"
-            f"Score alignment for these domains: {', '.join(domains)}"
+            f"{_domains_instruction_for(domain_key)}"
+        )
+
+        return [
+            {"role": "system", "content": _system_prompt_for(domain_key)},
+            {"role": "user", "content": user_content},
+        ]
+
+    def _build_batch_messages(
+        self, tasks: List[Tuple[int, str, str]], domains: List[str]
+    ) -> List[Dict[str, str]]:
+        """
+        Construct the system and user messages for a multi-task prompt.
+
+        Args:
+            tasks: List of (task_id, title, description) tuples.
+            domains: List of domain names to score against.
+
+        Returns:
+            List of message dictionaries for the Chat Completions API.
+        """
+        task_payload = json.dumps(
+            [
+                {"id": task_id, "title": title, "description": description}
+                for task_id, title, description in tasks
+            ]
         )
 
+        domain_key = tuple(domains)
+        user_content = f"Tasks: {task_payload}\n\n{_domains_instruction_for(domain_key)}"
+
         return [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _batch_system_prompt_for(domain_key)},
             {"role": "user", "content": user_content},
         ]
 
@@ -432,37 +768,40 @@ class ExternalAIScorer:
         if not raw_json:
             raise ValueError("Empty response from AI")
 
-        data = json.loads(raw_json)
+        return self._clean_scores(_json_loads(raw_json), domains)
 
-        # Ensure top-level keys exist
-        if "relevance_scores" not in data or "confidence" not in data:
-            raise ValueError("Missing required top-level keys in JSON response")
+    def _clean_scores(self, data: Any, domains: List[str]) -> Dict[str, Any]:
+        """
+        Validate one decoded score object and clamp its values.
 
-        scores: Dict[str, Any] = data["relevance_scores"]
-        cleaned_scores: Dict[str, float] = {}
+        Args:
+            data: Decoded JSON object with relevance_scores and confidence.
+            domains: Expected domain keys.
 
-        # Validate and clamp each domain score
-        for domain in domains:
-            raw_score = scores.get(domain, 0.0)
-            try:
-                clean_val = float(raw_score)
-                # Clamp to [0.0, 1.0] range
-                clean_val = max(0.0, min(1.0, clean_val))
-            except (ValueError, TypeError):
-                clean_val = 0.0
+        Returns:
+            Validated dictionary with relevance_scores and confidence.
 
-            cleaned_scores[domain] = clean_val
+        Raises:
+            ValueError: If the object is missing required keys.
+        """
+        # Ensure top-level keys exist
+        if (
+            not isinstance(data, dict)
+            or "relevance_scores" not in data
+            or "confidence" not in data
+        ):
+            raise ValueError("Missing required top-level keys in JSON response")
 
-        # Validate and clamp confidence
-        try:
-            confidence = float(data.get("confidence", 0.0))
-            confidence = max(0.0, min(1.0, confidence))
-        except (ValueError, TypeError):
-            confidence = 0.0
+        scores: Dict[str, Any] = data["relevance_scores"]
+        if not isinstance(scores, dict):
+            raise ValueError("relevance_scores must be a JSON object")
 
+        # Validate and clamp each domain score, then confidence
         return {
-            "relevance_scores": cleaned_scores,
-            "confidence": confidence,
+            "relevance_scores": {
+                domain: _unit_interval(scores.get(domain, 0.0)) for domain in domains
+            },
+            "confidence": _unit_interval(data["confidence"]),
         }
 
     def _get_error_response(
@@ -49,7 +49,8 @@ Decision Contract:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .cache import AIScoringCache
 from .external_scorer import ExternalAIScorer
@@ -69,6 +70,24 @@ SCORING_METHOD_CACHE = "cached"
 SCORING_METHOD_AI = "ai_scored"
 SCORING_METHOD_FALLBACK = "fallback"
 
+# Relevance assigned to every domain when no scoring layer succeeds
+DEFAULT_RELEVANCE = 0.25
+
+# Upper bound on memoized fallback dicts (one per distinct domain set)
+_FALLBACK_CACHE_MAX = 128
+
+# Importance/urgency at or above this count as "high" for the quadrant
+QUADRANT_THRESHOLD = 0.5
+
+# Eisenhower quadrant indexed as [is_important][is_urgent] (bools index 0/1)
+_QUADRANT_TABLE: Tuple[Tuple[str, str], Tuple[str, str]] = (
+    ("Q4", "Q3"),  # not important: Delete/Drop, Delegate
+    ("Q2", "Q1"),  # important: Schedule, Do Now
+)
+
+# (relevance, confidence, scoring_method, error_code, error_message)
+_ScoreOutcome = Tuple[Mapping[str, float], float, str, Optional[str], Optional[str]]
+
 
 # ---------------------------------------------------------------------------
 # Main Orchestrator Class
@@ -95,6 +114,9 @@ class AIOrchestrator:
         ai_available (bool): Whether AI scoring is available.
     """
 
+    # Read-only fallback relevance per domain tuple, shared across instances
+    _fallback_relevance: Dict[Tuple[str, ...], Mapping[str, float]] = {}
+
     def __init__(
         self,
         skip_ai_init: bool = False,
@@ -169,32 +191,19 @@ class AIOrchestrator:
         error_code: Optional[str] = None
         error_message: Optional[str] = None
 
-        # Default relevance (used if all layers fail)
-        domains = list(user_weights.keys())
-        relevance: Dict[str, float] = {k: 0.25 for k in domains}
+        # Default relevance (used if all layers fail); shared and read-only
+        fallback_relevance = self._get_fallback_relevance(user_weights)
+        relevance: Mapping[str, float] = fallback_relevance
         confidence: float = 0.0
 
         # ─────────────────────────────────────────────────────────────────────
         # LAYER 1: RULE-BASED SHORT-CIRCUIT
         # ─────────────────────────────────────────────────────────────────────
-        try:
-            should_skip, deterministic_scores = self.rules_engine.get_short_circuit_decision(
-                task_title,
-                task_description,
-                user_weights,
-            )
-
-            if should_skip and deterministic_scores:
-                logger.info(
-                    f"AIOrchestrator: Rule-based short-circuit for '{task_title}'"
-                )
-                relevance = deterministic_scores.get("relevance_scores", relevance)
-                confidence = deterministic_scores.get("confidence", 1.0)
-                scoring_method = SCORING_METHOD_RULES
-
-        except Exception as e:
-            logger.warning(f"AIOrchestrator: Rule engine failed: {e}")
-            # Continue to next layer
+        rule_scores = self._apply_rules(task_title, task_description, user_weights)
+        if rule_scores is not None:
+            relevance = rule_scores.get("relevance_scores", relevance)
+            confidence = rule_scores.get("confidence", 1.0)
+            scoring_method = SCORING_METHOD_RULES
 
         # ─────────────────────────────────────────────────────────────────────
         # LAYER 2 & 3: CACHE-WRAPPED AI SCORING
@@ -204,15 +213,7 @@ class AIOrchestrator:
                 # Define the AI scoring function for cache wrapper
                 def ai_scoring_func() -> Dict[str, Any]:
                     if not self.ai_available or self.ai_service is None:
-                        logger.warning(
-                            "AIOrchestrator: AI service not available, returning fallback"
-                        )
-                        return {
-                            "relevance_scores": {k: 0.25 for k in domains},
-                            "confidence": 0.0,
-                            "error_code": "AI_NOT_CONFIGURED",
-                            "error_message": "AI service is not configured",
-                        }
+                        return self._ai_unavailable_scores(fallback_relevance)
 
                     return self.ai_service.score_task(
                         task_title,
@@ -228,30 +229,9 @@ class AIOrchestrator:
                     scoring_func=ai_scoring_func,
                 )
 
-                relevance = final_scores.get("relevance_scores", relevance)
-                confidence = final_scores.get("confidence", 0.0)
-                error_code = final_scores.get("error_code")
-                error_message = final_scores.get("error_message")
-
-                # Determine scoring method from results
-                if error_code:
-                    scoring_method = SCORING_METHOD_FALLBACK
-                    logger.warning(
-                        f"AIOrchestrator: Scoring returned error: {error_code}"
-                    )
-                elif confidence > 0:
-                    # Check if this was a cache hit or fresh AI score
-                    # (Cache manager doesn't distinguish, so we mark as AI)
-                    scoring_method = SCORING_METHOD_AI
-                    logger.info(
-                        f"AIOrchestrator: AI scoring successful "
-                        f"(confidence={confidence:.2f})"
-                    )
-                else:
-                    scoring_method = SCORING_METHOD_FALLBACK
-                    logger.warning(
-                        "AIOrchestrator: AI returned zero confidence, using fallback"
-                    )
+                (
+                    relevance, confidence, scoring_method, error_code, error_message
+                ) = self._interpret_scores(final_scores, relevance)
 
             except Exception as e:
                 logger.exception(
@@ -261,10 +241,240 @@ class AIOrchestrator:
                 error_message = str(e)
                 scoring_method = SCORING_METHOD_FALLBACK
 
+        return self._build_contract(
+            task_title=task_title,
+            relevance=relevance,
+            confidence=confidence,
+            scoring_method=scoring_method,
+            error_code=error_code,
+            error_message=error_message,
+            user_weights=user_weights,
+            due_date=due_date,
+            effort_estimate=effort_estimate,
+            fallback_relevance=fallback_relevance,
+        )
+
+    def get_relevance_scores_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        user_weights: Dict[str, float],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Score several tasks of one user, sharing cache and AI round-trips.
+
+        Runs the same layers as get_relevance_scores, but resolves all cache
+        lookups with one batched read and sends every cache miss to the AI
+        in a single batch prompt instead of one request per task.
+
+        Args:
+            tasks: List of dicts with keys "id", "title", "description" and
+                   optionally "due_date" and "effort_estimate".
+            user_weights: Dictionary of domain weights shared by all tasks.
+
+        Returns:
+            Dictionary mapping each task id to its decision contract.
+            Never raises exceptions.
+        """
+        logger.info(f"AIOrchestrator: Starting batch pipeline for {len(tasks)} tasks")
+
+        fallback_relevance = self._get_fallback_relevance(user_weights)
+
+        # task id -> (relevance, confidence, method, error_code, error_message)
+        outcomes: Dict[int, _ScoreOutcome] = {}
+        pending: List[Dict[str, Any]] = []
+
+        # LAYER 1: RULE-BASED SHORT-CIRCUIT
+        for task in tasks:
+            rule_scores = self._apply_rules(task["title"], task["description"], user_weights)
+            if rule_scores is not None:
+                outcomes[task["id"]] = (
+                    rule_scores.get("relevance_scores", fallback_relevance),
+                    rule_scores.get("confidence", 1.0),
+                    SCORING_METHOD_RULES,
+                    None,
+                    None,
+                )
+            else:
+                pending.append(task)
+
+        # LAYER 2 & 3: BATCHED CACHE LOOKUP, THEN ONE AI CALL FOR ALL MISSES
+        if pending:
+            try:
+                cached = self.cache_manager.get_many_scores(
+                    [(t["title"], t["description"], user_weights) for t in pending]
+                )
+                misses = [t for t, hit in zip(pending, cached) if hit is None]
+
+                if not misses:
+                    fresh: Dict[int, Dict[str, Any]] = {}
+                elif not self.ai_available or self.ai_service is None:
+                    fresh = {
+                        t["id"]: self._ai_unavailable_scores(fallback_relevance)
+                        for t in misses
+                    }
+                else:
+                    fresh = self.ai_service.score_tasks_batch(
+                        [(t["id"], t["title"], t["description"]) for t in misses],
+                        user_weights,
+                    )
+                    for t in misses:
+                        self.cache_manager.set_score(
+                            t["title"], t["description"], user_weights, fresh[t["id"]]
+                        )
+
+                for task, hit in zip(pending, cached):
+                    final_scores = hit if hit is not None else fresh[task["id"]]
+                    outcomes[task["id"]] = self._interpret_scores(
+                        final_scores, fallback_relevance
+                    )
+
+            except Exception as e:
+                logger.exception(f"AIOrchestrator: Batch pipeline failure: {e}")
+                for task in pending:
+                    outcomes.setdefault(
+                        task["id"],
+                        (fallback_relevance, 0.0, SCORING_METHOD_FALLBACK, "PIPELINE_ERROR", str(e)),
+                    )
+
+        importances = self._compute_importance_batch(
+            [outcomes[task["id"]][0] for task in tasks], user_weights
+        )
+
+        return {
+            task["id"]: self._build_contract(
+                task_title=task["title"],
+                relevance=outcomes[task["id"]][0],
+                confidence=outcomes[task["id"]][1],
+                scoring_method=outcomes[task["id"]][2],
+                error_code=outcomes[task["id"]][3],
+                error_message=outcomes[task["id"]][4],
+                user_weights=user_weights,
+                due_date=task.get("due_date"),
+                effort_estimate=task.get("effort_estimate"),
+                fallback_relevance=fallback_relevance,
+                importance=importance,
+            )
+            for task, importance in zip(tasks, importances)
+        }
+
+    def _apply_rules(
+        self,
+        task_title: str,
+        task_description: str,
+        user_weights: Dict[str, float],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run the rule engine, returning its scores only if it short-circuits.
+
+        Rule engine failures are logged and treated as "no short-circuit".
+        """
+        try:
+            should_skip, deterministic_scores = self.rules_engine.get_short_circuit_decision(
+                task_title,
+                task_description,
+                user_weights,
+            )
+
+            if should_skip and deterministic_scores:
+                logger.info(
+                    f"AIOrchestrator: Rule-based short-circuit for '{task_title}'"
+                )
+                return deterministic_scores
+
+        except Exception as e:
+            logger.warning(f"AIOrchestrator: Rule engine failed: {e}")
+            # Continue to next layer
+
+        return None
+
+    def _ai_unavailable_scores(
+        self, fallback_relevance: Mapping[str, float]
+    ) -> Dict[str, Any]:
+        """Scores returned in place of an AI call when the service is not configured."""
+        logger.warning("AIOrchestrator: AI service not available, returning fallback")
+        return {
+            "relevance_scores": dict(fallback_relevance),
+            "confidence": 0.0,
+            "error_code": "AI_NOT_CONFIGURED",
+            "error_message": "AI service is not configured",
+        }
+
+    def _interpret_scores(
+        self,
+        final_scores: Dict[str, Any],
+        default_relevance: Mapping[str, float],
+    ) -> _ScoreOutcome:
+        """
+        Determine the scoring method from a cached or fresh AI result.
+
+        Returns:
+            Tuple of (relevance, confidence, scoring_method, error_code, error_message).
+        """
+        relevance = final_scores.get("relevance_scores", default_relevance)
+        confidence = final_scores.get("confidence", 0.0)
+        error_code = final_scores.get("error_code")
+        error_message = final_scores.get("error_message")
+
+        # Determine scoring method from results
+        if error_code:
+            scoring_method = SCORING_METHOD_FALLBACK
+            logger.warning(
+                f"AIOrchestrator: Scoring returned error: {error_code}"
+            )
+        elif confidence > 0:
+            # Check if this was a cache hit or fresh AI score
+            # (Cache manager doesn't distinguish, so we mark as AI)
+            scoring_method = SCORING_METHOD_AI
+            logger.info(
+                f"AIOrchestrator: AI scoring successful "
+                f"(confidence={confidence:.2f})"
+            )
+        else:
+            scoring_method = SCORING_METHOD_FALLBACK
+            logger.warning(
+                "AIOrchestrator: AI returned zero confidence, using fallback"
+            )
+
+        return relevance, confidence, scoring_method, error_code, error_message
+
+    def _build_contract(
+        self,
+        task_title: str,
+        relevance: Mapping[str, float],
+        confidence: float,
+        scoring_method: str,
+        error_code: Optional[str],
+        error_message: Optional[str],
+        user_weights: Dict[str, float],
+        due_date: Optional[str],
+        effort_estimate: Optional[int],
+        fallback_relevance: Mapping[str, float],
+        importance: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute derived values and assemble the decision contract.
+
+        Args:
+            task_title: Task title (for logging only).
+            relevance: Final domain relevance scores.
+            confidence: Final confidence value.
+            scoring_method: How the relevance was determined.
+            error_code: Machine-readable error code, if any.
+            error_message: Human-readable error description, if any.
+            user_weights: Dictionary of domain weights.
+            due_date: Optional ISO date string (YYYY-MM-DD) for urgency calc.
+            effort_estimate: Optional effort level (1-5) for urgency calc.
+            fallback_relevance: The shared fallback mapping (copied if used).
+            importance: Precomputed importance (batch callers); computed if None.
+
+        Returns:
+            Complete decision contract dictionary.
+        """
         # ─────────────────────────────────────────────────────────────────────
         # LAYER 4: COMPUTE DERIVED VALUES
         # ─────────────────────────────────────────────────────────────────────
-        importance = self._compute_importance(relevance, user_weights)
+        if importance is None:
+            importance = self._compute_importance(relevance, user_weights)
         urgency = compute_urgency(due_date, effort_estimate)
         quadrant = self._compute_quadrant(importance, urgency)
         rationale = self._make_rationale(relevance, importance, urgency, scoring_method)
@@ -273,7 +483,10 @@ class AIOrchestrator:
         # BUILD FINAL CONTRACT
         # ─────────────────────────────────────────────────────────────────────
         contract: Dict[str, Any] = {
-            "relevance_scores": relevance,
+            # Callers get their own copy of the shared fallback mapping
+            "relevance_scores": (
+                dict(relevance) if relevance is fallback_relevance else relevance
+            ),
             "confidence": float(confidence),
             "importance_score": importance,
             "urgency_score": urgency,
@@ -296,8 +509,37 @@ class AIOrchestrator:
 
         return contract
 
+    def _get_fallback_relevance(
+        self, user_weights: Mapping[str, float]
+    ) -> Mapping[str, float]:
+        """
+        Return the memoized equal-relevance fallback for a set of domains.
+
+        Weight sets are stable per user, so the {domain: 0.25} mapping is
+        built once per domain tuple and reused as a read-only proxy.
+
+        Args:
+            user_weights: Dictionary of domain weights (only keys are used).
+
+        Returns:
+            Read-only mapping of each domain to DEFAULT_RELEVANCE.
+        """
+        domains = tuple(user_weights)
+        fallback = self._fallback_relevance.get(domains)
+
+        if fallback is None:
+            if len(self._fallback_relevance) >= _FALLBACK_CACHE_MAX:
+                self._fallback_relevance.clear()
+            fallback = MappingProxyType({d: DEFAULT_RELEVANCE for d in domains})
+            self._fallback_relevance[domains] = fallback
+
+        return fallback
+
     def _compute_importance(
-        self, relevance: Dict[str, float], weights: Dict[str, float]
+        self,
+        relevance: Mapping[str, float],
+        weights: Mapping[str, float],
+        weight_vector: Optional[List[float]] = None,
     ) -> float:
         """
         Calculate weighted importance score from relevance and user weights.
@@ -307,20 +549,50 @@ class AIOrchestrator:
         Args:
             relevance: Dictionary of domain relevance scores (0-1).
             weights: Dictionary of user-defined domain weights (should sum to 1).
+            weight_vector: The weights' values as floats, in `weights` order.
+                           Built once per batch by _compute_importance_batch.
 
         Returns:
             Importance score in range [0.0, 1.0], rounded to 4 decimal places.
         """
-        total: float = 0.0
-
-        for domain, rel_score in relevance.items():
-            weight = weights.get(domain, 0.0)
-            total += float(rel_score) * float(weight)
+        if weight_vector is None:
+            weight_vector = [float(w) for w in weights.values()]
+
+        # Domains without a weight would be multiplied by zero, so only the
+        # weighted domains are looked up
+        total: float = sum(
+            float(relevance.get(domain, 0.0)) * weight
+            for domain, weight in zip(weights, weight_vector)
+        )
 
         # Clamp to [0, 1] and round for consistency
         total = max(0.0, min(1.0, total))
         return round(total, 4)
 
+    def _compute_importance_batch(
+        self,
+        relevances: List[Mapping[str, float]],
+        weights: Mapping[str, float],
+    ) -> List[float]:
+        """
+        Calculate importance for many tasks that share the same weights.
+
+        The weight vector is resolved once for the whole batch; only the
+        relevance lookups are done per task.
+
+        Args:
+            relevances: One relevance mapping per task.
+            weights: Dictionary of user-defined domain weights.
+
+        Returns:
+            Importance score per task, in input order.
+        """
+        weight_vector = [float(w) for w in weights.values()]
+        return [
+            self._compute_importance(relevance, weights, weight_vector)
+            for relevance in relevances
+        ]
+
     def _compute_quadrant(self, importance: float, urgency: float) -> str:
         """
         Assign Eisenhower Matrix quadrant based on importance and urgency.
@@ -338,22 +610,15 @@ class AIOrchestrator:
         Returns:
             Quadrant identifier: 'Q1', 'Q2', 'Q3', or 'Q4'.
         """
-        # Threshold is 0.5 (inclusive for "high" classification)
-        is_important = importance >= 0.5
-        is_urgent = urgency >= 0.5
-
-        if is_important and is_urgent:
-            return "Q1"  # Do Now
-        elif is_important and not is_urgent:
-            return "Q2"  # Schedule
-        elif not is_important and is_urgent:
-            return "Q3"  # Delegate
-        else:
-            return "Q4"  # Delete/Drop
+        # Threshold is inclusive for "high" classification; the two flags
+        # index straight into the precomputed 2×2 table
+        return _QUADRANT_TABLE[importance >= QUADRANT_THRESHOLD][
+            urgency >= QUADRANT_THRESHOLD
+        ]
 
     def _make_rationale(
         self,
-        relevance: Dict[str, float],
+        relevance: Mapping[str, float],
         importance: float,
         urgency: float,
         scoring_method: str,
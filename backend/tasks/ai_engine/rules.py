@@ -1,7 +1,8 @@
 # tasks/ai_engine/rules.py
 
 import logging
-from typing import Dict, Any, Tuple, Optional, List
+import re
+from typing import Dict, Any, Tuple, Optional, List, Pattern
 
 # Configure logging for rule-engine auditing
 logger = logging.getLogger(__name__)
@@ -32,6 +33,9 @@ class DecisionEngine:
         self.dominance_threshold = dominance_threshold
         self.ceiling_others = ceiling_others
 
+        # Compiled once at import and shared by every engine instance
+        self._keyword_patterns: Dict[str, Pattern[str]] = _KEYWORD_PATTERNS
+
     def get_short_circuit_decision(
         self, 
         title: str, 
@@ -44,17 +48,16 @@ class DecisionEngine:
         Returns:
             Tuple: (should_skip: bool, precomputed_scores: Optional[dict])
         """
-        title_lower = title.lower()
-        desc_lower = description.lower()
-
         # Rule 1: Evaluate Dominant Weight Axiom
         # If one goal is heavily prioritized and others are negligible.
+        # Checked first: a few float comparisons, and most weightings fail it,
+        # so the text is only lowercased and scanned when it can matter.
         is_dominant, dominant_domain = self._check_weight_dominance(user_weights)
 
         if is_dominant and dominant_domain:
             # Rule 2 & 3: Keyword-Goal Certainty / Single-Domain Tasks
             # Check if task content aligns strongly with the dominant domain.
-            if self._has_keyword_match(title_lower, desc_lower, dominant_domain):
+            if self._has_keyword_match(title.lower(), description.lower(), dominant_domain):
                 logger.info(f"Short-circuit triggered for domain: {dominant_domain}")
                 return True, self._generate_deterministic_scores(dominant_domain, user_weights)
 
@@ -65,12 +68,14 @@ class DecisionEngine:
         if not weights:
             return False, None
 
-        sorted_weights = sorted(weights.items(), key=lambda x: x[1], reverse=True)
-        max_domain, max_weight = sorted_weights[0]
+        # A single max() pass; no need to sort the whole mapping
+        max_domain = max(weights, key=weights.__getitem__)
         
         # Axiom check: Max weight >= threshold AND all others <= ceiling
-        if max_weight >= self.dominance_threshold:
-            others_under_ceiling = all(w <= self.ceiling_others for d, w in sorted_weights[1:])
+        if weights[max_domain] >= self.dominance_threshold:
+            others_under_ceiling = all(
+                w <= self.ceiling_others for d, w in weights.items() if d != max_domain
+            )
             if others_under_ceiling:
                 return True, max_domain
         
@@ -78,9 +83,11 @@ class DecisionEngine:
 
     def _has_keyword_match(self, title: str, description: str, domain: str) -> bool:
         """Checks if domain-specific keywords exist in title or description."""
-        keywords = self.DOMAIN_KEYWORDS.get(domain, [])
+        pattern = self._keyword_patterns.get(domain)
+        if pattern is None:
+            return False
         content = f"{title} {description}"
-        return any(word in content for word in keywords)
+        return pattern.search(content) is not None
 
     def _generate_deterministic_scores(
         self, 
@@ -97,4 +104,13 @@ class DecisionEngine:
                 for domain in weights.keys()
             },
             "confidence": 1.0
-        }
\ No newline at end of file
+        }
+
+
+# One compiled alternation per domain: a single scan over the text replaces
+# the per-keyword substring checks.
+_KEYWORD_PATTERNS: Dict[str, Pattern[str]] = {
+    domain: re.compile("|".join(re.escape(word) for word in words))
+    for domain, words in DecisionEngine.DOMAIN_KEYWORDS.items()
+    if words
+}
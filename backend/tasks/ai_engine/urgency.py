@@ -58,6 +58,10 @@ EFFORT_WEIGHT: float = 0.2
 EFFORT_MIN: int = 1
 EFFORT_MAX: int = 5
 
+# Precomputed reciprocals so the per-call arithmetic is multiply-only
+_INV_LOOKAHEAD: float = 1.0 / MAX_LOOKAHEAD_DAYS
+_INV_EFFORT_SPAN: float = 1.0 / (EFFORT_MAX - EFFORT_MIN)
+
 
 # ---------------------------------------------------------------------------
 # PUBLIC API
@@ -111,13 +115,7 @@ def compute_urgency(
     due_component: float = _compute_due_date_component(due_date, now)
     effort_component: float = _compute_effort_component(effort_hours)
 
-    # Apply weighted combination
-    # Formula: U = D × 0.8 + E × 0.2
-    urgency: float = (due_component * DUE_DATE_WEIGHT) + (effort_component * EFFORT_WEIGHT)
-
-    # Clamp to [0.0, 1.0] and round for consistency
-    urgency = max(0.0, min(1.0, urgency))
-    return round(urgency, 4)
+    return _urgency_kernel(due_component, effort_component)
 
 
 # ---------------------------------------------------------------------------
@@ -125,6 +123,31 @@ def compute_urgency(
 # ---------------------------------------------------------------------------
 
 
+def _urgency_kernel(due_component: float, effort_component: float) -> float:
+    """
+    Combine the two urgency components into the final score.
+
+    Scalar-only arithmetic: all parsing and None handling happens in the
+    component helpers, so this stays a handful of float operations.
+
+    Args:
+        due_component: Due date component in range [0.0, 1.0].
+        effort_component: Effort component in range [0.0, 1.0].
+
+    Returns:
+        float: Urgency score in range [0.0, 1.0], rounded to 4 decimal places.
+    """
+    # Formula: U = D × 0.8 + E × 0.2
+    urgency: float = due_component * DUE_DATE_WEIGHT + effort_component * EFFORT_WEIGHT
+
+    # Components are already in [0.0, 1.0]; clamp and round once at the boundary
+    if urgency > 1.0:
+        return 1.0
+    if urgency < 0.0:
+        return 0.0
+    return round(urgency, 4)
+
+
 def _compute_due_date_component(
     due_date: Optional[Union[str, datetime.date]],
     now: datetime.datetime,
@@ -152,19 +175,30 @@ def _compute_due_date_component(
     if parsed_date is None:
         return 0.0
 
-    today: datetime.date = now.date()
-    days_until: int = (parsed_date - today).days
+    return _due_component_from_days((parsed_date - now.date()).days)
+
+
+def _due_component_from_days(days_until: int) -> float:
+    """
+    Scalar core of the due date component, after all date handling.
 
+    Args:
+        days_until: Whole days from today to the due date (negative if overdue).
+
+    Returns:
+        float: Due date component in range [0.0, 1.0].
+    """
     # Overdue or due today → maximum urgency
     if days_until <= 0:
         return 1.0
 
+    # Past the horizon → no due date urgency
+    if days_until >= MAX_LOOKAHEAD_DAYS:
+        return 0.0
+
     # Linear decay: 1.0 at day 0, approaching 0.0 at MAX_LOOKAHEAD_DAYS
     # Formula: D = 1 - (days_until / MAX_LOOKAHEAD_DAYS)
-    component: float = 1.0 - (days_until / float(MAX_LOOKAHEAD_DAYS))
-
-    # Clamp to [0.0, 1.0]
-    return max(0.0, min(1.0, component))
+    return 1.0 - days_until * _INV_LOOKAHEAD
 
 
 def _compute_effort_component(effort: Optional[Union[int, float]]) -> float:
@@ -199,9 +233,8 @@ def _compute_effort_component(effort: Optional[Union[int, float]]) -> float:
 
     # Linear scale: (effort - 1) / (EFFORT_MAX - EFFORT_MIN)
     # With EFFORT_MIN=1, EFFORT_MAX=5: (effort - 1) / 4
-    component: float = (effort_val - EFFORT_MIN) / (EFFORT_MAX - EFFORT_MIN)
-
-    return max(0.0, min(1.0, component))
+    # effort_val is already clamped, so the result is guaranteed to be in [0, 1]
+    return (effort_val - EFFORT_MIN) * _INV_EFFORT_SPAN
 
 
 def _parse_date(due_date: Union[str, datetime.date]) -> Optional[datetime.date]:
@@ -210,7 +243,7 @@ def _parse_date(due_date: Union[str, datetime.date]) -> Optional[datetime.date]:
 
     Supports:
         - datetime.date objects (returned as-is)
-        - ISO format strings: 'YYYY-MM-DD'
+        - ISO format strings: 'YYYY-MM-DD' (zero-padded, exactly 10 chars)
 
     Args:
         due_date: Date string or date object.
@@ -224,10 +257,21 @@ def _parse_date(due_date: Union[str, datetime.date]) -> Optional[datetime.date]:
 
     # Attempt string parsing
     if isinstance(due_date, str):
+        # Reject malformed shapes up front so the exception path stays rare
+        if len(due_date) != 10 or due_date[4] != "-" or due_date[7] != "-":
+            return None
+        if not (
+            due_date[0:4].isdigit()
+            and due_date[5:7].isdigit()
+            and due_date[8:10].isdigit()
+        ):
+            return None
+
         try:
-            return datetime.datetime.strptime(due_date, "%Y-%m-%d").date()
+            # C-implemented parser, much faster than strptime
+            return datetime.date.fromisoformat(due_date)
         except ValueError:
-            # Invalid format → return None (handled by caller)
+            # Well-formed but out of range (e.g. month 13) → None
             return None
 
     # Unknown type
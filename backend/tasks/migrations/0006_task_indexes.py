@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-15 23:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0002_goalweights'),
+        ('tasks', '0005_task_last_analyzed_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_completed', '-priority_score', 'due_date'], name='task_user_prio_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'is_prioritized'], name='task_user_isprio_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['celery_task_id'], name='task_celery_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.15 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+QUADRANT_CODES = {'Q1': 1, 'Q2': 2, 'Q3': 3, 'Q4': 4}
+
+
+def quadrant_labels_to_codes(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    for label, code in QUADRANT_CODES.items():
+        Task.objects.filter(quadrant=label).update(quadrant_code=code)
+
+
+def quadrant_codes_to_labels(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    for label, code in QUADRANT_CODES.items():
+        Task.objects.filter(quadrant_code=code).update(quadrant=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='quadrant_code',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(quadrant_labels_to_codes, quadrant_codes_to_labels),
+        migrations.RemoveField(
+            model_name='task',
+            name='quadrant',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='quadrant_code',
+            new_name='quadrant',
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='quadrant',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Q1'), (2, 'Q2'), (3, 'Q3'), (4, 'Q4')], help_text='Eisenhower quadrant assignment.', null=True, verbose_name='quadrant'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-15 23:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0002_goalweights'),
+        ('tasks', '0007_task_quadrant_smallint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_celery_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('celery_task_id__isnull', False)), fields=['celery_task_id'], name='task_celery_active_idx'),
+        ),
+    ]
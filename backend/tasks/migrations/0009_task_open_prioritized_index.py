@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-15 23:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0002_goalweights'),
+        ('tasks', '0008_task_celery_partial_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_user_isprio_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_completed', False)), fields=['user', 'is_prioritized', '-priority_score'], name='task_open_prio_idx'),
+        ),
+    ]
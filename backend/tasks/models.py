@@ -76,12 +76,15 @@ class Task(models.Model):
         verbose_name=_("urgency score"),
         help_text=_("Urgency score ∈ [0,1].")
     )
-    QUADRANT_CHOICES = [
-        ('Q1','Q1'), ('Q2','Q2'), ('Q3','Q3'), ('Q4','Q4')
-    ]
-    quadrant = models.CharField(
-        max_length=2,
-        choices=QUADRANT_CHOICES,
+    class Quadrant(models.IntegerChoices):
+        # Stored as a small integer; the label is what the API exposes
+        Q1 = 1, 'Q1'
+        Q2 = 2, 'Q2'
+        Q3 = 3, 'Q3'
+        Q4 = 4, 'Q4'
+
+    quadrant = models.PositiveSmallIntegerField(
+        choices=Quadrant.choices,
         null=True,
         blank=True,
         verbose_name=_("quadrant"),
@@ -107,6 +110,28 @@ class Task(models.Model):
         verbose_name_plural = _("Tasks")
         # Default sorting: active tasks first, then by earliest due date
         ordering = ['is_completed','-priority_score', 'due_date', '-created_at']
+        indexes = [
+            # Per-user list view: filter by user, read rows in default ordering
+            models.Index(
+                fields=['user', 'is_completed', '-priority_score', 'due_date'],
+                name='task_user_prio_idx',
+            ),
+            # Prioritized list view: open tasks of a user that finished scoring,
+            # read in priority order straight from the index (no sort step);
+            # completed tasks never appear there, so they are left out
+            models.Index(
+                fields=['user', 'is_prioritized', '-priority_score'],
+                condition=models.Q(is_completed=False),
+                name='task_open_prio_idx',
+            ),
+            # Lookups of the background scoring job by its Celery id; rows that
+            # were never dispatched (NULL id) are left out of the index
+            models.Index(
+                fields=['celery_task_id'],
+                condition=models.Q(celery_task_id__isnull=False),
+                name='task_celery_active_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"Task for {self.user.username}: {self.title}"
\ No newline at end of file
@@ -1,5 +1,7 @@
 # tasks/serializers.py
 
+import uuid
+
 from django.db import transaction
 from rest_framework import serializers
 from .models import Task
@@ -8,6 +10,9 @@ import logging
 logger = logging.getLogger(__name__)
 
 class TaskSerializer(serializers.ModelSerializer):
+    # Stored as an integer code; exposed as its "Q1".."Q4" label
+    quadrant = serializers.CharField(source='get_quadrant_display', read_only=True)
+
     class Meta:
         model = Task
         # explicit whitelist: only user-truth fields + system-read fields required by UI
@@ -36,15 +41,23 @@ class TaskSerializer(serializers.ModelSerializer):
         if not user or not user.is_authenticated:
             raise serializers.ValidationError("Authentication required to create a task.")
 
+        # Pre-generate the Celery job id so it is written with the INSERT,
+        # instead of a second UPDATE once the job has been enqueued.
+        celery_task_id = uuid.uuid4().hex
+
         # Persist task in DB; transaction ensures on_commit trigger enqueues job only after commit.
         with transaction.atomic():
-            task = Task.objects.create(user=user, **validated_data)
+            task = Task.objects.create(
+                user=user, celery_task_id=celery_task_id, **validated_data
+            )
 
             # Enqueue Celery worker after transaction commit with minimal context.
             def trigger_ai():
                 from .ai_engine.celery_tasks import run_ai_relevance_scoring
                 # Pass only the task id and user id. Worker will fetch required context.
-                run_ai_relevance_scoring.delay(task.id, user.id)
+                run_ai_relevance_scoring.apply_async(
+                    args=(task.id, user.id), task_id=celery_task_id
+                )
 
             transaction.on_commit(trigger_ai)
 
@@ -0,0 +1,26 @@
+# tasks/signals.py
+"""
+Cache invalidation for the per-user weights read by the scoring workers.
+
+Both GoalWeights and Goals feed _get_user_weights, so any write to either
+drops the user's cached weights; the next scoring run rebuilds them. The
+delete waits for the surrounding transaction to commit, otherwise a worker
+reading in between would cache the old row again.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from goals.models import Goal, GoalWeights
+
+from .ai_engine.cache import invalidate_user_weights
+
+
+@receiver(post_save, sender=GoalWeights)
+@receiver(post_delete, sender=GoalWeights)
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+def invalidate_cached_user_weights(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_user_weights(user_id))
@@ -27,7 +27,7 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from goals.models import GoalWeights
 from tasks.ai_engine.urgency import (
@@ -35,6 +35,9 @@ from tasks.ai_engine.urgency import (
     compute_urgency,
     _compute_due_date_component,
     _compute_effort_component,
+    _due_component_from_days,
+    _parse_date,
+    _urgency_kernel,
 )
 from tasks.ai_engine.orchestrator import AIOrchestrator
 
@@ -47,7 +50,7 @@ User = get_user_model()
 # ===========================================================================
 
 
-class TestComputeUrgency(TestCase):
+class TestComputeUrgency(SimpleTestCase):
     """
     Test suite for the compute_urgency function.
     
@@ -59,10 +62,12 @@ class TestComputeUrgency(TestCase):
     - Edge cases (None values, invalid formats)
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         """Set up a fixed reference time for deterministic testing."""
-        # Fixed reference: January 15, 2024 at noon UTC
-        self.fixed_now = datetime.datetime(
+        super().setUpClass()
+        # Fixed reference: January 15, 2024 at noon UTC (immutable, so shared)
+        cls.fixed_now = datetime.datetime(
             2024, 1, 15, 12, 0, 0, tzinfo=datetime.timezone.utc
         )
 
@@ -89,98 +94,51 @@ class TestComputeUrgency(TestCase):
         self.assertEqual(result, 1.0, "Severely overdue task must still be 1.0")
 
     # -----------------------------------------------------------------------
-    # Due Today Tests
-    # -----------------------------------------------------------------------
-
-    def test_task_due_today_returns_near_maximum(self) -> None:
-        """A task due today should have urgency close to 1.0."""
-        due_today = "2024-01-15"
-        
-        result = compute_urgency(due_date=due_today, effort_hours=3, now=self.fixed_now)
-        
-        # Due today means days_until=0, so due_component=1.0
-        # With effort=3: effort_component = (3-1)/4 = 0.5
-        # urgency = 1.0 * 0.8 + 0.5 * 0.2 = 0.9
-        self.assertGreaterEqual(result, 0.8, "Task due today should be high urgency")
-        self.assertLessEqual(result, 1.0)
-
-    # -----------------------------------------------------------------------
-    # Future Due Date Tests (Linear Decay)
+    # Table-Driven Scalar Cases
     # -----------------------------------------------------------------------
 
-    def test_task_due_in_one_day(self) -> None:
-        """A task due tomorrow has high but not maximum urgency."""
-        due_tomorrow = "2024-01-16"
-        
-        result = compute_urgency(due_date=due_tomorrow, effort_hours=1, now=self.fixed_now)
-        
-        # days_until=1, due_component = 1 - 1/30 ≈ 0.9667
-        # effort=1: effort_component = 0
-        # urgency = 0.9667 * 0.8 + 0 * 0.2 ≈ 0.7733
-        self.assertGreater(result, 0.7)
-        self.assertLess(result, 0.9)
-
-    def test_task_due_in_fifteen_days(self) -> None:
-        """A task due in 15 days (midpoint) should have ~0.4 urgency."""
-        due_in_15_days = "2024-01-30"
-        
-        result = compute_urgency(due_date=due_in_15_days, effort_hours=1, now=self.fixed_now)
-        
-        # days_until=15, due_component = 1 - 15/30 = 0.5
-        # effort=1: effort_component = 0
-        # urgency = 0.5 * 0.8 + 0 * 0.2 = 0.4
-        self.assertAlmostEqual(result, 0.4, places=2)
-
-    def test_task_due_in_thirty_days(self) -> None:
-        """A task due at the MAX_LOOKAHEAD_DAYS horizon should have minimal urgency."""
-        due_in_30_days = "2024-02-14"
-        
-        result = compute_urgency(due_date=due_in_30_days, effort_hours=1, now=self.fixed_now)
-        
-        # days_until=30, due_component = 1 - 30/30 = 0.0
-        # effort=1: effort_component = 0
-        # urgency = 0.0
-        self.assertAlmostEqual(result, 0.0, places=2)
-
-    def test_task_due_in_forty_days_returns_near_zero(self) -> None:
-        """A task due beyond MAX_LOOKAHEAD_DAYS should have ~0.0 urgency."""
-        due_in_40_days = "2024-02-24"
-        
-        result = compute_urgency(due_date=due_in_40_days, effort_hours=1, now=self.fixed_now)
-        
-        # days_until=40 > MAX_LOOKAHEAD_DAYS
-        # due_component = max(0, 1 - 40/30) = max(0, -0.33) = 0.0
-        self.assertAlmostEqual(result, 0.0, places=2)
-
-    # -----------------------------------------------------------------------
-    # No Due Date Tests (Effort-Only)
-    # -----------------------------------------------------------------------
-
-    def test_no_due_date_with_minimum_effort(self) -> None:
-        """No deadline + minimum effort (1) should return 0.0."""
-        result = compute_urgency(due_date=None, effort_hours=1, now=self.fixed_now)
-        
-        # due_component = 0 (no date)
-        # effort_component = (1-1)/4 = 0
-        # urgency = 0 * 0.8 + 0 * 0.2 = 0.0
-        self.assertEqual(result, 0.0)
-
-    def test_no_due_date_with_maximum_effort(self) -> None:
-        """No deadline + maximum effort (5) should return 0.2."""
-        result = compute_urgency(due_date=None, effort_hours=5, now=self.fixed_now)
-        
-        # due_component = 0 (no date)
-        # effort_component = (5-1)/4 = 1.0
-        # urgency = 0 * 0.8 + 1.0 * 0.2 = 0.2
-        self.assertEqual(result, 0.2)
-
-    def test_no_due_date_with_medium_effort(self) -> None:
-        """No deadline + medium effort (3) should return 0.1."""
-        result = compute_urgency(due_date=None, effort_hours=3, now=self.fixed_now)
-        
-        # effort_component = (3-1)/4 = 0.5
-        # urgency = 0 * 0.8 + 0.5 * 0.2 = 0.1
-        self.assertEqual(result, 0.1)
+    # (due_date, effort, expected urgency) relative to fixed_now (2024-01-15).
+    # Dates are pre-built date objects; one ISO string row keeps the
+    # string-parsing path covered (see also TestParseDate).
+    # urgency = due_component × 0.8 + effort_component × 0.2, where
+    # due_component = 1 - days_until/30 and effort_component = (effort-1)/4
+    CASES = [
+        # Due today: 1.0 × 0.8 + 0.5 × 0.2
+        (datetime.date(2024, 1, 15), 3, 0.9),
+        # Due tomorrow: (1 - 1/30) × 0.8
+        (datetime.date(2024, 1, 16), 1, 0.7733),
+        # Due in 15 days (midpoint), as an ISO string: 0.5 × 0.8
+        ("2024-01-30", 1, 0.4),
+        # Due at the MAX_LOOKAHEAD_DAYS horizon
+        (datetime.date(2024, 2, 14), 1, 0.0),
+        # Beyond the horizon: due_component floors at 0.0
+        (datetime.date(2024, 2, 24), 1, 0.0),
+        # Due in 5 days: (1 - 5/30) × 0.8
+        (datetime.date(2024, 1, 20), 1, 0.6667),
+        # No due date: effort-only contribution
+        (None, 1, 0.0),
+        (None, 3, 0.1),
+        (None, 5, 0.2),
+        # Both None
+        (None, None, 0.0),
+        # Invalid date string: due_component=0, only effort contributes
+        ("not-a-date", 3, 0.1),
+        # Effort clamped to [1, 5]
+        (None, 0, 0.0),
+        (None, 10, 0.2),
+    ]
+
+    def test_urgency_table(self) -> None:
+        """compute_urgency matches the formula for each (due_date, effort) row."""
+        for due_date, effort, expected in self.CASES:
+            with self.subTest(due_date=due_date, effort=effort):
+                result = compute_urgency(
+                    due_date=due_date, effort_hours=effort, now=self.fixed_now
+                )
+
+                self.assertAlmostEqual(result, expected, places=4)
+                self.assertGreaterEqual(result, 0.0)
+                self.assertLessEqual(result, 1.0)
 
     # -----------------------------------------------------------------------
     # Effort Impact Tests
@@ -188,7 +146,7 @@ class TestComputeUrgency(TestCase):
 
     def test_effort_boosts_urgency_for_same_due_date(self) -> None:
         """Higher effort should increase urgency for the same due date."""
-        due_date = "2024-01-25"  # 10 days out
+        due_date = datetime.date(2024, 1, 25)  # 10 days out
         
         low_effort_result = compute_urgency(due_date=due_date, effort_hours=1, now=self.fixed_now)
         high_effort_result = compute_urgency(due_date=due_date, effort_hours=5, now=self.fixed_now)
@@ -203,55 +161,18 @@ class TestComputeUrgency(TestCase):
         difference = high_effort_result - low_effort_result
         self.assertAlmostEqual(difference, 0.2, places=3)
 
-    # -----------------------------------------------------------------------
-    # Edge Cases and Defensive Programming
-    # -----------------------------------------------------------------------
 
-    def test_none_due_date_and_none_effort(self) -> None:
-        """Both None values should return 0.0."""
-        result = compute_urgency(due_date=None, effort_hours=None, now=self.fixed_now)
-        
-        self.assertEqual(result, 0.0)
-
-    def test_invalid_date_format_returns_zero(self) -> None:
-        """An invalid date string should be handled gracefully."""
-        result = compute_urgency(due_date="not-a-date", effort_hours=3, now=self.fixed_now)
-        
-        # Invalid date → due_component=0, only effort contributes
-        # effort_component = 0.5, urgency = 0 * 0.8 + 0.5 * 0.2 = 0.1
-        self.assertAlmostEqual(result, 0.1, places=2)
-
-    def test_effort_clamped_to_valid_range(self) -> None:
-        """Effort values outside [1, 5] should be clamped."""
-        # Effort below minimum
-        result_low = compute_urgency(due_date=None, effort_hours=0, now=self.fixed_now)
-        self.assertEqual(result_low, 0.0)  # Clamped to 1, then (1-1)/4 = 0
-        
-        # Effort above maximum  
-        result_high = compute_urgency(due_date=None, effort_hours=10, now=self.fixed_now)
-        self.assertEqual(result_high, 0.2)  # Clamped to 5, then (5-1)/4 = 1.0 → 1.0 * 0.2 = 0.2
-
-    def test_date_object_input(self) -> None:
-        """Should accept datetime.date objects, not just strings."""
-        due_date = datetime.date(2024, 1, 20)  # 5 days from fixed_now
-        
-        result = compute_urgency(due_date=due_date, effort_hours=1, now=self.fixed_now)
-        
-        # days_until=5, due_component = 1 - 5/30 ≈ 0.8333
-        # urgency = 0.8333 * 0.8 ≈ 0.6667
-        self.assertGreater(result, 0.6)
-        self.assertLess(result, 0.7)
-
-
-class TestDueDateComponent(TestCase):
+class TestDueDateComponent(SimpleTestCase):
     """
     Unit tests for the _compute_due_date_component helper function.
     
     Isolated tests for the temporal proximity logic.
     """
 
-    def setUp(self) -> None:
-        self.fixed_now = datetime.datetime(
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.fixed_now = datetime.datetime(
             2024, 1, 15, 12, 0, 0, tzinfo=datetime.timezone.utc
         )
 
@@ -270,8 +191,42 @@ class TestDueDateComponent(TestCase):
         result = _compute_due_date_component("2024-01-15", self.fixed_now)
         self.assertEqual(result, 1.0)
 
+    def test_days_kernel_linear_decay(self) -> None:
+        """The integer-days core decays linearly and floors at the horizon."""
+        self.assertEqual(_due_component_from_days(-3), 1.0)
+        self.assertEqual(_due_component_from_days(0), 1.0)
+        self.assertAlmostEqual(_due_component_from_days(15), 0.5)
+        self.assertEqual(_due_component_from_days(MAX_LOOKAHEAD_DAYS), 0.0)
+        self.assertEqual(_due_component_from_days(MAX_LOOKAHEAD_DAYS + 10), 0.0)
 
-class TestEffortComponent(TestCase):
+
+class TestParseDate(SimpleTestCase):
+    """
+    Unit tests for the _parse_date helper function.
+    """
+
+    def test_iso_string_parses(self) -> None:
+        """A zero-padded 'YYYY-MM-DD' string should parse to a date."""
+        self.assertEqual(_parse_date("2024-01-15"), datetime.date(2024, 1, 15))
+
+    def test_date_object_returned_as_is(self) -> None:
+        """Date objects should pass through unchanged."""
+        due = datetime.date(2024, 1, 15)
+        self.assertIs(_parse_date(due), due)
+
+    def test_malformed_shapes_return_none(self) -> None:
+        """Wrong length, separators or non-digit fields should return None."""
+        for value in ("", "not-a-date", "2024/01/15", "2024-1-15", "20240115", "2024-0a-15"):
+            with self.subTest(value=value):
+                self.assertIsNone(_parse_date(value))
+
+    def test_out_of_range_date_returns_none(self) -> None:
+        """Well-formed but impossible dates should return None."""
+        self.assertIsNone(_parse_date("2024-13-01"))
+        self.assertIsNone(_parse_date("2024-02-30"))
+
+
+class TestEffortComponent(SimpleTestCase):
     """
     Unit tests for the _compute_effort_component helper function.
     """
@@ -297,57 +252,43 @@ class TestEffortComponent(TestCase):
         self.assertEqual(result, 0.5)
 
 
+class TestUrgencyKernel(SimpleTestCase):
+    """
+    Unit tests for the _urgency_kernel scalar combination step.
+    """
+
+    def test_weighted_combination(self) -> None:
+        """D × 0.8 + E × 0.2, rounded to 4 places."""
+        self.assertEqual(_urgency_kernel(0.5, 0.5), 0.5)
+        self.assertEqual(_urgency_kernel(1.0, 0.0), 0.8)
+        self.assertEqual(_urgency_kernel(0.0, 1.0), 0.2)
+
+    def test_output_is_clamped(self) -> None:
+        """Out-of-range components never push the score outside [0, 1]."""
+        self.assertEqual(_urgency_kernel(2.0, 2.0), 1.0)
+        self.assertEqual(_urgency_kernel(-1.0, 0.0), 0.0)
+
+
 # ===========================================================================
 # GOAL WEIGHTS VALIDATION TESTS
 # ===========================================================================
 
 
-class TestGoalWeightsValidation(TestCase):
+class TestGoalWeightsValidation(SimpleTestCase):
     """
     Test suite for GoalWeights model validation.
     
     Ensures the weight-sum constraint (must equal 1.0) is enforced.
+    Validation only, on unsaved instances: no database access.
     """
 
     def setUp(self) -> None:
-        """Create a test user for GoalWeights."""
-        self.user = User.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123"
-        )
+        """Build an in-memory owner for GoalWeights."""
+        self.user = User(pk=1, username="testuser")
 
-    def test_valid_weights_sum_to_one(self) -> None:
-        """Weights that sum to exactly 1.0 should save successfully."""
-        weights = GoalWeights(
-            user=self.user,
-            work_bills=0.4,
-            study=0.3,
-            health=0.2,
-            relationships=0.1
-        )
-        
-        # Should not raise
-        weights.full_clean()
-        weights.save()
-        
-        self.assertEqual(GoalWeights.objects.count(), 1)
-
-    def test_equal_weights_are_valid(self) -> None:
-        """Default equal weights (0.25 each) should be valid."""
-        weights = GoalWeights(
-            user=self.user,
-            work_bills=0.25,
-            study=0.25,
-            health=0.25,
-            relationships=0.25
-        )
-        
-        weights.full_clean()
-        weights.save()
-        
-        total = weights.work_bills + weights.study + weights.health + weights.relationships
-        self.assertAlmostEqual(total, 1.0, places=3)
+    def _full_clean(self, weights: GoalWeights) -> None:
+        # Skip the user field: its FK-exists and uniqueness checks query the DB
+        weights.full_clean(exclude=["user"])
 
     def test_weights_below_one_raises_validation_error(self) -> None:
         """Weights summing to less than 1.0 should raise ValidationError."""
@@ -360,7 +301,7 @@ class TestGoalWeightsValidation(TestCase):
         )
         
         with self.assertRaises(ValidationError) as ctx:
-            weights.full_clean()
+            self._full_clean(weights)
         
         self.assertIn("sum of all weights must be exactly 1.0", str(ctx.exception).lower())
 
@@ -375,7 +316,7 @@ class TestGoalWeightsValidation(TestCase):
         )
         
         with self.assertRaises(ValidationError) as ctx:
-            weights.full_clean()
+            self._full_clean(weights)
         
         self.assertIn("sum of all weights must be exactly 1.0", str(ctx.exception).lower())
 
@@ -391,7 +332,7 @@ class TestGoalWeightsValidation(TestCase):
         )
         
         # Should not raise due to tolerance
-        weights.full_clean()
+        self._full_clean(weights)
 
     def test_individual_weights_clamped_to_range(self) -> None:
         """Individual weights must be between 0.0 and 1.0."""
@@ -405,7 +346,54 @@ class TestGoalWeightsValidation(TestCase):
         )
         
         with self.assertRaises(ValidationError):
-            weights_negative.full_clean()
+            self._full_clean(weights_negative)
+
+
+class TestGoalWeightsPersistence(TestCase):
+    """
+    GoalWeights validation tests that save to the database.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the test user once for the class (unusable password: no hashing)."""
+        cls.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password=None,
+        )
+
+    def test_valid_weights_sum_to_one(self) -> None:
+        """Weights that sum to exactly 1.0 should save successfully."""
+        weights = GoalWeights(
+            user=self.user,
+            work_bills=0.4,
+            study=0.3,
+            health=0.2,
+            relationships=0.1
+        )
+        
+        # Should not raise
+        weights.full_clean()
+        weights.save()
+        
+        self.assertEqual(GoalWeights.objects.count(), 1)
+
+    def test_equal_weights_are_valid(self) -> None:
+        """Default equal weights (0.25 each) should be valid."""
+        weights = GoalWeights(
+            user=self.user,
+            work_bills=0.25,
+            study=0.25,
+            health=0.25,
+            relationships=0.25
+        )
+        
+        weights.full_clean()
+        weights.save()
+        
+        total = weights.work_bills + weights.study + weights.health + weights.relationships
+        self.assertAlmostEqual(total, 1.0, places=3)
 
 
 # ===========================================================================
@@ -413,7 +401,7 @@ class TestGoalWeightsValidation(TestCase):
 # ===========================================================================
 
 
-class TestImportanceCalculation(TestCase):
+class TestImportanceCalculation(SimpleTestCase):
     """
     Test suite for importance score calculation.
     
@@ -422,23 +410,24 @@ class TestImportanceCalculation(TestCase):
     This ensures the weighted average formula is correctly implemented.
     """
 
-    def setUp(self) -> None:
-        """Initialize orchestrator for testing."""
-        # Patch the ExternalAIScorer to avoid API calls
-        self.patcher = patch(
-            "tasks.ai_engine.orchestrator.ExternalAIScorer"
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initialize one orchestrator for the whole class."""
+        super().setUpClass()
+        # Patch the ExternalAIScorer to avoid API calls (undone after the class)
+        cls.mock_ai = cls.enterClassContext(
+            patch("tasks.ai_engine.orchestrator.ExternalAIScorer")
         )
-        self.mock_ai = self.patcher.start()
-
-    def tearDown(self) -> None:
-        self.patcher.stop()
+        # _compute_importance is a pure function of its arguments, so one
+        # instance can be shared by every test
+        cls.orchestrator = AIOrchestrator()
 
     def test_perfect_alignment_with_dominant_weight(self) -> None:
         """
         A task with 1.0 relevance to a category with 0.5 weight
         should contribute 0.5 to importance.
         """
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         relevance = {
             "work_bills": 1.0,
@@ -462,7 +451,7 @@ class TestImportanceCalculation(TestCase):
         """
         A task with partial relevance to multiple domains.
         """
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         relevance = {
             "work_bills": 0.8,
@@ -485,7 +474,7 @@ class TestImportanceCalculation(TestCase):
 
     def test_zero_relevance_returns_zero(self) -> None:
         """A task with zero relevance to all domains should have 0.0 importance."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         relevance = {
             "work_bills": 0.0,
@@ -506,7 +495,7 @@ class TestImportanceCalculation(TestCase):
 
     def test_full_relevance_full_weight_returns_one(self) -> None:
         """Full relevance (1.0) to a domain with full weight (1.0) = 1.0."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         relevance = {"single_domain": 1.0}
         weights = {"single_domain": 1.0}
@@ -517,7 +506,7 @@ class TestImportanceCalculation(TestCase):
 
     def test_importance_is_clamped(self) -> None:
         """Importance should be clamped to [0.0, 1.0] even with edge values."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         # Edge case: weights don't sum to 1 (hypothetical misconfiguration)
         relevance = {"a": 1.0, "b": 1.0}
@@ -528,13 +517,67 @@ class TestImportanceCalculation(TestCase):
         # Raw: 1.0 * 0.8 + 1.0 * 0.8 = 1.6 → clamped to 1.0
         self.assertEqual(importance, 1.0)
 
+    def test_importance_matches_weighted_sum(self) -> None:
+        """Importance should match Σ(relevance × weight) for any domain count."""
+        orchestrator = self.orchestrator
+
+        for num_domains in (1, 3, 4, 7):
+            relevance = {f"d{i}": (i + 1) / 10.0 for i in range(num_domains)}
+            weights = {f"d{i}": 1.0 / num_domains for i in range(num_domains)}
+            expected = sum(relevance[d] * weights[d] for d in relevance)
+
+            importance = orchestrator._compute_importance(relevance, weights)
+
+            self.assertAlmostEqual(importance, round(min(1.0, expected), 4), places=4)
+
+    def test_missing_weight_treated_as_zero(self) -> None:
+        """Domains absent from the weights dict contribute nothing."""
+        orchestrator = self.orchestrator
+
+        importance = orchestrator._compute_importance(
+            {"work_bills": 1.0, "unknown": 1.0}, {"work_bills": 0.3}
+        )
+
+        self.assertAlmostEqual(importance, 0.3, places=4)
+
+    def test_precomputed_weight_vector_matches(self) -> None:
+        """A reused weight vector gives the same result; relevance order is irrelevant."""
+        orchestrator = self.orchestrator
+        weights = {"work_bills": 0.5, "study": 0.3, "health": 0.2}
+        relevance = {"health": 1.0, "study": 0.5, "work_bills": 0.2}
+
+        importance = orchestrator._compute_importance(
+            relevance, weights, weight_vector=[0.5, 0.3, 0.2]
+        )
+
+        self.assertAlmostEqual(importance, 0.5 * 0.2 + 0.3 * 0.5 + 0.2 * 1.0, places=4)
+        self.assertEqual(importance, orchestrator._compute_importance(relevance, weights))
+
+    def test_batch_entry_point_matches_scalar(self) -> None:
+        """_compute_importance_batch returns the scalar result for each task, in order."""
+        orchestrator = self.orchestrator
+        weights = {"work_bills": 0.5, "study": 0.3, "health": 0.2}
+        relevances = [
+            {"work_bills": 1.0, "study": 0.0, "health": 0.0},
+            {"work_bills": 0.0, "study": 1.0, "health": 1.0},
+            {"health": 0.4},
+        ]
+
+        importances = orchestrator._compute_importance_batch(relevances, weights)
+
+        self.assertEqual(
+            importances,
+            [orchestrator._compute_importance(r, weights) for r in relevances],
+        )
+        self.assertEqual(importances[:2], [0.5, 0.5])
+
 
 # ===========================================================================
 # QUADRANT ASSIGNMENT TESTS
 # ===========================================================================
 
 
-class TestQuadrantAssignment(TestCase):
+class TestQuadrantAssignment(SimpleTestCase):
     """
     Test suite for Eisenhower Matrix quadrant assignment.
     
@@ -545,16 +588,17 @@ class TestQuadrantAssignment(TestCase):
     - Q4: Neither Urgent nor Important (both < 0.5)
     """
 
-    def setUp(self) -> None:
-        self.patcher = patch("tasks.ai_engine.orchestrator.ExternalAIScorer")
-        self.mock_ai = self.patcher.start()
-
-    def tearDown(self) -> None:
-        self.patcher.stop()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.mock_ai = cls.enterClassContext(
+            patch("tasks.ai_engine.orchestrator.ExternalAIScorer")
+        )
+        cls.orchestrator = AIOrchestrator()
 
     def test_q1_urgent_and_important(self) -> None:
         """High urgency + high importance → Q1 (Do Now)."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.8, urgency=0.9)
         
@@ -562,7 +606,7 @@ class TestQuadrantAssignment(TestCase):
 
     def test_q2_important_not_urgent(self) -> None:
         """High importance + low urgency → Q2 (Schedule)."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.7, urgency=0.3)
         
@@ -570,7 +614,7 @@ class TestQuadrantAssignment(TestCase):
 
     def test_q3_urgent_not_important(self) -> None:
         """Low importance + high urgency → Q3 (Delegate)."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.2, urgency=0.8)
         
@@ -578,7 +622,7 @@ class TestQuadrantAssignment(TestCase):
 
     def test_q4_neither(self) -> None:
         """Low importance + low urgency → Q4 (Delete/Drop)."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.3, urgency=0.2)
         
@@ -586,7 +630,7 @@ class TestQuadrantAssignment(TestCase):
 
     def test_boundary_at_half(self) -> None:
         """Exactly 0.5 on both dimensions → Q1 (inclusive boundary)."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.5, urgency=0.5)
         
@@ -594,7 +638,7 @@ class TestQuadrantAssignment(TestCase):
 
     def test_importance_boundary(self) -> None:
         """Importance exactly at 0.5 with low urgency → Q2."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.5, urgency=0.4)
         
@@ -602,7 +646,7 @@ class TestQuadrantAssignment(TestCase):
 
     def test_urgency_boundary(self) -> None:
         """Urgency exactly at 0.5 with low importance → Q3."""
-        orchestrator = AIOrchestrator()
+        orchestrator = self.orchestrator
         
         quadrant = orchestrator._compute_quadrant(importance=0.4, urgency=0.5)
         
@@ -24,19 +24,32 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
+from celery.exceptions import Retry
 from django.contrib.auth import get_user_model
-from django.test import TestCase, TransactionTestCase, override_settings
-
-from goals.models import GoalWeights
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from openai import APITimeoutError, RateLimitError
+from rest_framework.test import APIClient
+
+from goals.models import Goal, GoalWeights
+from tasks.ai_engine.cache import AIScoringCache, user_weights_cache_key
 from tasks.ai_engine.celery_tasks import (
+    _get_orchestrator,
     _get_user_weights,
     _should_skip_scoring,
+    bulk_rescore_tasks,
+    rescore_user_tasks,
     run_ai_relevance_scoring,
+    run_batch_ai_relevance_scoring,
 )
-from tasks.ai_engine.external_scorer import ExternalAIScorer
+from tasks.ai_engine.external_scorer import ExternalAIScorer, reset_shared_clients
+from tasks.ai_engine.rules import DecisionEngine
 from tasks.ai_engine.orchestrator import (
     SCORING_METHOD_AI,
     SCORING_METHOD_FALLBACK,
@@ -44,6 +57,8 @@ from tasks.ai_engine.orchestrator import (
     AIOrchestrator,
 )
 from tasks.models import Task
+from tasks.serializers import TaskSerializer
+from tasks.views import SCORE_STATUS_MAX_WAIT, SCORE_STATUS_RETRY_AFTER
 
 User = get_user_model()
 
@@ -53,40 +68,62 @@ User = get_user_model()
 # ===========================================================================
 
 
+def _stub_openai_response(content: str) -> SimpleNamespace:
+    """Wrap raw message content in the chat-completion response shape."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+# The common scorer payload, serialized once for the whole module
+DEFAULT_RELEVANCE_SCORES: Dict[str, float] = {"work_bills": 0.8, "study": 0.2}
+DEFAULT_CONFIDENCE = 0.9
+DEFAULT_RESPONSE_JSON = json.dumps({
+    "relevance_scores": DEFAULT_RELEVANCE_SCORES,
+    "confidence": DEFAULT_CONFIDENCE,
+})
+
+
 def create_mock_openai_response(
-    relevance_scores: Dict[str, float],
+    relevance_scores: Dict[str, float] | None = None,
     confidence: float = 0.85,
-) -> MagicMock:
+) -> SimpleNamespace:
     """
-    Create a mock OpenAI API response object.
+    Create a stub OpenAI API response object.
 
     Args:
-        relevance_scores: Dictionary of domain -> relevance score.
+        relevance_scores: Dictionary of domain -> relevance score. When
+                          omitted, the pre-serialized default payload
+                          (DEFAULT_RELEVANCE_SCORES at DEFAULT_CONFIDENCE)
+                          is used and `confidence` is ignored.
         confidence: Confidence value for the response.
 
     Returns:
-        MagicMock configured to return the specified response.
+        Plain object exposing `choices[0].message.content` (nothing on the
+        response itself is asserted, so no MagicMock call-tracking needed).
     """
-    response_json = json.dumps({
-        "relevance_scores": relevance_scores,
-        "confidence": confidence,
-    })
-
-    mock_choice = MagicMock()
-    mock_choice.message.content = response_json
-
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
+    if relevance_scores is None:
+        response_json = DEFAULT_RESPONSE_JSON
+    else:
+        response_json = json.dumps({
+            "relevance_scores": relevance_scores,
+            "confidence": confidence,
+        })
 
-    return mock_response
+    return _stub_openai_response(response_json)
 
 
 def create_test_user(username: str = "testuser") -> User:
-    """Create a test user with unique username."""
+    """
+    Create a test user with unique username.
+
+    No test logs in with a password (API tests use force_authenticate), so
+    the user gets an unusable password and skips PBKDF2 hashing entirely.
+    """
     return User.objects.create_user(
         username=username,
         email=f"{username}@example.com",
-        password="testpass123",
+        password=None,
     )
 
 
@@ -162,10 +199,7 @@ class TestExternalAIScorer(TestCase):
         # Setup mock
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
-        mock_client.chat.completions.create.return_value = create_mock_openai_response(
-            {"work_bills": 0.8, "study": 0.2},
-            confidence=0.9,
-        )
+        mock_client.chat.completions.create.return_value = create_mock_openai_response()
 
         with override_settings(OPENAI_API_KEY="test-key"):
             scorer = ExternalAIScorer(api_key="test-key")
@@ -182,13 +216,11 @@ class TestExternalAIScorer(TestCase):
             # Verify result structure
             self.assertIn("relevance_scores", result)
             self.assertIn("confidence", result)
-            self.assertEqual(result["confidence"], 0.9)
+            self.assertEqual(result["confidence"], DEFAULT_CONFIDENCE)
 
     @patch("tasks.ai_engine.external_scorer.OpenAI")
     def test_scorer_handles_api_timeout(self, mock_openai_class: MagicMock) -> None:
         """Scorer should handle API timeout gracefully."""
-        from openai import APITimeoutError
-
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
         mock_client.chat.completions.create.side_effect = APITimeoutError(request=MagicMock())
@@ -208,8 +240,6 @@ class TestExternalAIScorer(TestCase):
     @patch("tasks.ai_engine.external_scorer.OpenAI")
     def test_scorer_handles_rate_limit(self, mock_openai_class: MagicMock) -> None:
         """Scorer should handle rate limit errors gracefully."""
-        from openai import RateLimitError
-
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
 
@@ -234,6 +264,72 @@ class TestExternalAIScorer(TestCase):
             self.assertEqual(result["confidence"], 0.0)
             self.assertEqual(result["error_code"], "RATE_LIMIT")
 
+    @patch("tasks.ai_engine.external_scorer.OpenAI")
+    def test_scorers_share_one_client_per_configuration(
+        self, mock_openai_class: MagicMock
+    ) -> None:
+        """Scorers with the same key should reuse a single OpenAI client."""
+        first = ExternalAIScorer(api_key="shared-key")
+        second = ExternalAIScorer(api_key="shared-key")
+
+        self.assertIs(first.client, second.client)
+        mock_openai_class.assert_called_once_with(api_key="shared-key")
+
+    def test_prompt_messages_use_cached_domain_parts(self) -> None:
+        """Only the task text varies between prompts for the same domains."""
+        scorer = ExternalAIScorer(api_key="prompt-key")
+        first = scorer._build_messages("Invoice", "Q3", ["work_bills", "study"])
+        second = scorer._build_messages("Essay", "", ["work_bills", "study"])
+
+        self.assertIs(first[0]["content"], second[0]["content"])
+        self.assertEqual(
+            first[1]["content"],
+            "Task Title: Invoice\nTask Description: Q3\n\n"
+            "Score alignment for these domains: work_bills, study",
+        )
+
+    @patch("tasks.ai_engine.external_scorer.OpenAI")
+    def test_reset_shared_clients_closes_pools(self, mock_openai_class: MagicMock) -> None:
+        """Resetting should close pooled clients unless told to just drop them."""
+        mock_openai_class.side_effect = lambda **kwargs: MagicMock()
+
+        first = ExternalAIScorer(api_key="reset-key").client
+        reset_shared_clients()
+        first.close.assert_called_once_with()
+
+        second = ExternalAIScorer(api_key="reset-key").client
+        reset_shared_clients(close=False)
+        second.close.assert_not_called()
+
+        self.assertEqual(mock_openai_class.call_count, 2)
+
+    def test_system_prompt_includes_domain_schema(self) -> None:
+        """The cached system prompt should embed the domain schema example."""
+        with override_settings(OPENAI_API_KEY=None):
+            scorer = ExternalAIScorer(api_key=None)
+
+        messages = scorer._build_messages("Title", "Desc", ["work_bills", "study"])
+
+        self.assertIn('"work_bills": 0.5', messages[0]["content"])
+        self.assertIn("work_bills, study", messages[1]["content"])
+
+    def test_response_scores_are_coerced_and_clamped(self) -> None:
+        """Out-of-range, non-numeric, NaN and missing scores are normalized."""
+        with override_settings(OPENAI_API_KEY=None):
+            scorer = ExternalAIScorer(api_key=None)
+
+        result = scorer._validate_and_parse_response(
+            '{"relevance_scores": {"work_bills": 1.7, "study": NaN, "health": "high"},'
+            ' "confidence": "0.8"}',
+            ["work_bills", "study", "health", "relationships"],
+        )
+
+        self.assertEqual(
+            result["relevance_scores"],
+            {"work_bills": 1.0, "study": 0.0, "health": 0.0, "relationships": 0.0},
+        )
+        self.assertEqual(result["confidence"], 0.8)
+
     def test_scorer_health_check(self) -> None:
         """Health check should return component status."""
         with override_settings(OPENAI_API_KEY=None):
@@ -330,11 +426,28 @@ class TestAIOrchestrator(TestCase):
             user_weights=user_weights,
         )
 
-        # May or may not trigger rule-based (depends on rule engine thresholds)
-        # But should always return valid contract
-        self.assertIn("quadrant", result)
+        # Dominant work weight + "bill" keyword: decided without AI or cache
+        self.assertEqual(result["scoring_method"], SCORING_METHOD_RULES)
+        self.assertEqual(result["relevance_scores"]["work_bills"], 1.0)
         self.assertIn(result["quadrant"], ["Q1", "Q2", "Q3", "Q4"])
 
+    def test_fallback_relevance_is_memoized_but_contract_gets_copy(self) -> None:
+        """Fallback mapping is shared per domain set; contracts get own dicts."""
+        orchestrator = AIOrchestrator(skip_ai_init=True)
+        weights = {"work_bills": 0.5, "study": 0.5}
+
+        self.assertIs(
+            orchestrator._get_fallback_relevance(weights),
+            orchestrator._get_fallback_relevance(dict(weights)),
+        )
+
+        first = orchestrator.get_relevance_scores("Task A", "", weights)
+        second = orchestrator.get_relevance_scores("Task B", "", weights)
+
+        self.assertEqual(first["relevance_scores"], {"work_bills": 0.25, "study": 0.25})
+        self.assertIsInstance(first["relevance_scores"], dict)
+        self.assertIsNot(first["relevance_scores"], second["relevance_scores"])
+
     def test_orchestrator_health_check(self) -> None:
         """Health check should return all component statuses."""
         orchestrator = AIOrchestrator(skip_ai_init=True)
@@ -345,6 +458,96 @@ class TestAIOrchestrator(TestCase):
         self.assertIn("ai_available", health)
 
 
+# ===========================================================================
+# RULE ENGINE TESTS
+# ===========================================================================
+
+
+class TestDecisionEngine(TestCase):
+    """Tests for the rule-based short-circuit engine."""
+
+    def setUp(self) -> None:
+        self.engine = DecisionEngine()
+        self.work_dominant = {
+            "work_bills": 0.7,
+            "study": 0.1,
+            "health": 0.1,
+            "relationships": 0.1,
+        }
+
+    def test_keyword_in_dominant_domain_short_circuits(self) -> None:
+        """A dominant-domain keyword should skip AI with deterministic scores."""
+        should_skip, scores = self.engine.get_short_circuit_decision(
+            "Pay electricity bill", "Monthly utility payment", self.work_dominant
+        )
+
+        self.assertTrue(should_skip)
+        self.assertEqual(scores["relevance_scores"]["work_bills"], 1.0)
+        self.assertEqual(scores["relevance_scores"]["study"], 0.0)
+
+    def test_multi_word_keyword_matches(self) -> None:
+        """Multi-word keywords should match as a phrase."""
+        self.assertTrue(
+            self.engine._has_keyword_match("remember to call mom", "", "relationships")
+        )
+        self.assertFalse(
+            self.engine._has_keyword_match("call the plumber", "", "relationships")
+        )
+
+    def test_no_keyword_does_not_short_circuit(self) -> None:
+        """Text without dominant-domain keywords should fall through to AI."""
+        should_skip, scores = self.engine.get_short_circuit_decision(
+            "Water the plants", "", self.work_dominant
+        )
+
+        self.assertFalse(should_skip)
+        self.assertIsNone(scores)
+
+
+# ===========================================================================
+# CACHE TESTS
+# ===========================================================================
+
+
+class TestAIScoringCache(TestCase):
+    """Tests for the AIScoringCache layer."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.cache_manager = AIScoringCache()
+        self.weights = {"work_bills": 0.5, "study": 0.5}
+
+    def test_get_many_scores_returns_hits_and_misses_in_order(self) -> None:
+        """Batch lookup should return cached results and None for misses."""
+        scored = {"relevance_scores": {"work_bills": 0.9, "study": 0.1}, "confidence": 0.8}
+        self.cache_manager.get_or_set_score(
+            "Cached Task", "desc", self.weights, scoring_func=lambda: scored
+        )
+
+        results = self.cache_manager.get_many_scores([
+            ("Uncached Task", "desc", self.weights),
+            ("Cached Task", "desc", self.weights),
+        ])
+
+        self.assertEqual(results, [None, scored])
+
+    def test_get_many_scores_empty_input(self) -> None:
+        """An empty batch should return an empty list."""
+        self.assertEqual(self.cache_manager.get_many_scores([]), [])
+
+    def test_key_ignores_weight_values_and_whitespace(self) -> None:
+        """Relevance depends only on the text and the domains, not on weights."""
+        scored = {"relevance_scores": {"work_bills": 0.9, "study": 0.1}, "confidence": 0.8}
+        self.cache_manager.set_score("Pay  rent", "monthly", self.weights, scored)
+
+        results = self.cache_manager.get_many_scores([
+            ("pay rent ", "Monthly", {"study": 0.9, "work_bills": 0.1}),
+            ("Pay rent", "monthly", {"work_bills": 0.5, "health": 0.5}),
+        ])
+
+        self.assertEqual(results, [scored, None])
+
+
 # ===========================================================================
 # CELERY TASK TESTS (Synchronous)
 # ===========================================================================
@@ -355,6 +558,7 @@ class TestCeleryTaskHelpers(TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
+        cache.clear()
         self.user = create_test_user("celery_test_user")
 
     def test_get_user_weights_from_goal_weights(self) -> None:
@@ -374,6 +578,16 @@ class TestCeleryTaskHelpers(TestCase):
         self.assertEqual(weights["health"], 0.15)
         self.assertEqual(weights["relationships"], 0.05)
 
+    def test_get_user_weights_derived_from_goals(self) -> None:
+        """Should normalize active Goal weights when GoalWeights is missing."""
+        Goal.objects.create(user=self.user, title="Career", weight=6)
+        Goal.objects.create(user=self.user, title="Fitness", weight=2)
+        Goal.objects.create(user=self.user, title="Old", weight=9, is_archived=True)
+
+        weights = _get_user_weights(self.user.id)
+
+        self.assertEqual(weights, {"Career": 0.75, "Fitness": 0.25})
+
     def test_get_user_weights_fallback_to_defaults(self) -> None:
         """Should use equal weights when no GoalWeights exist."""
         # No GoalWeights created
@@ -385,6 +599,38 @@ class TestCeleryTaskHelpers(TestCase):
         self.assertEqual(weights["health"], 0.25)
         self.assertEqual(weights["relationships"], 0.25)
 
+    def test_get_user_weights_served_from_cache(self) -> None:
+        """A second lookup should not touch the database."""
+        Goal.objects.create(user=self.user, title="Career", weight=4)
+        first = _get_user_weights(self.user.id)
+
+        with self.assertNumQueries(0):
+            second = _get_user_weights(self.user.id)
+
+        self.assertEqual(first, second)
+
+    def test_goal_weights_change_invalidates_cached_weights(self) -> None:
+        """Saving GoalWeights should drop the user's cached weights."""
+        self.assertEqual(_get_user_weights(self.user.id)["work_bills"], 0.25)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_test_goal_weights(self.user, work_bills=0.7, study=0.1, health=0.1, relationships=0.1)
+
+        self.assertEqual(_get_user_weights(self.user.id)["work_bills"], 0.7)
+
+    def test_weights_invalidated_only_after_commit(self) -> None:
+        """A weights save inside atomic() should keep the entry until commit."""
+        _get_user_weights(self.user.id)
+        cache_key = user_weights_cache_key(self.user.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                create_test_goal_weights(self.user, work_bills=0.7, study=0.1, health=0.1, relationships=0.1)
+                # Uncommitted: a concurrent reader would still see the old row
+                self.assertIsNotNone(cache.get(cache_key))
+
+        self.assertIsNone(cache.get(cache_key))
+
     def test_should_skip_scoring_unprioritized_task(self) -> None:
         """Should not skip unprioritized tasks."""
         task = create_test_task(self.user)
@@ -415,17 +661,54 @@ class TestCeleryTaskHelpers(TestCase):
 
         self.assertFalse(should_skip)
 
+    def test_should_skip_scoring_uses_given_reference_time(self) -> None:
+        """A caller-supplied `now` decides the window instead of the clock."""
+        task = create_test_task(self.user)
+        task.is_prioritized = True
+        task.last_analyzed_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+        self.assertTrue(
+            _should_skip_scoring(task, now=task.last_analyzed_at + timedelta(minutes=59))
+        )
+        self.assertFalse(
+            _should_skip_scoring(task, now=task.last_analyzed_at + timedelta(minutes=61))
+        )
+
+    @patch("tasks.ai_engine.celery_tasks.AIOrchestrator")
+    def test_orchestrator_built_once_per_process(
+        self, mock_orchestrator_class: MagicMock
+    ) -> None:
+        """Repeated lookups should reuse one orchestrator instance."""
+        first = _get_orchestrator()
+        second = _get_orchestrator()
+
+        self.assertIs(first, second)
+        mock_orchestrator_class.assert_called_once_with()
+
+    @patch("tasks.ai_engine.celery_tasks.AIOrchestrator")
+    def test_orchestrator_rebuilt_when_api_key_changes(
+        self, mock_orchestrator_class: MagicMock
+    ) -> None:
+        """Changing OPENAI_API_KEY should drop the shared orchestrator."""
+        _get_orchestrator()
+
+        with override_settings(OPENAI_API_KEY="rotated-key"):
+            _get_orchestrator()
 
-class TestCeleryTaskExecution(TransactionTestCase):
+        self.assertEqual(mock_orchestrator_class.call_count, 2)
+
+
+class TestCeleryTaskExecution(TestCase):
     """
     Integration tests for the Celery task execution.
 
-    Uses TransactionTestCase because Celery tasks may use
-    select_for_update which requires real transactions.
+    Plain TestCase is enough: the scoring task takes no row locks (it
+    persists with a conditional UPDATE), so nothing needs real commits.
     """
 
     def setUp(self) -> None:
         """Set up test fixtures."""
+        cache.clear()
         self.user = create_test_user("execution_test_user")
         create_test_goal_weights(self.user)
 
@@ -455,9 +738,7 @@ class TestCeleryTaskExecution(TransactionTestCase):
         }
 
         # Execute task synchronously (without Celery broker)
-        result = run_ai_relevance_scoring.apply(
-            args=[task.id, self.user.id]
-        ).get()
+        result = run_ai_relevance_scoring(task.id, self.user.id)
 
         # Verify result
         self.assertIsNotNone(result)
@@ -466,7 +747,7 @@ class TestCeleryTaskExecution(TransactionTestCase):
         # Verify database state
         task.refresh_from_db()
         self.assertTrue(task.is_prioritized)
-        self.assertEqual(task.quadrant, "Q2")
+        self.assertEqual(task.quadrant, Task.Quadrant.Q2)
         self.assertAlmostEqual(task.importance_score, 0.65, places=2)
         self.assertAlmostEqual(task.urgency_score, 0.3, places=2)
         self.assertIsNotNone(task.last_analyzed_at)
@@ -476,9 +757,7 @@ class TestCeleryTaskExecution(TransactionTestCase):
         self, mock_orchestrator_class: MagicMock
     ) -> None:
         """Scoring a non-existent task should return None gracefully."""
-        result = run_ai_relevance_scoring.apply(
-            args=[99999, self.user.id]  # Non-existent task ID
-        ).get()
+        result = run_ai_relevance_scoring(99999, self.user.id)  # Non-existent task ID
 
         self.assertIsNone(result)
 
@@ -490,9 +769,7 @@ class TestCeleryTaskExecution(TransactionTestCase):
         task = create_test_task(self.user)
         other_user = create_test_user("other_user")
 
-        result = run_ai_relevance_scoring.apply(
-            args=[task.id, other_user.id]  # Wrong user
-        ).get()
+        result = run_ai_relevance_scoring(task.id, other_user.id)  # Wrong user
 
         self.assertIsNone(result)
 
@@ -510,9 +787,9 @@ class TestCeleryTaskExecution(TransactionTestCase):
         task.last_analyzed_at = datetime.now(timezone.utc)
         task.save()
 
-        result = run_ai_relevance_scoring.apply(
-            args=[task.id, self.user.id]
-        ).get()
+        # The filtered fetch misses; one narrow lookup classifies the miss
+        with self.assertNumQueries(2):
+            result = run_ai_relevance_scoring(task.id, self.user.id)
 
         # Should skip without calling orchestrator
         self.assertEqual(result["status"], "skipped")
@@ -526,7 +803,7 @@ class TestCeleryTaskExecution(TransactionTestCase):
         task = create_test_task(self.user)
         task.is_prioritized = True
         task.last_analyzed_at = datetime.now(timezone.utc)
-        task.quadrant = "Q4"
+        task.quadrant = Task.Quadrant.Q4
         task.save()
 
         # Mock orchestrator
@@ -542,14 +819,69 @@ class TestCeleryTaskExecution(TransactionTestCase):
             "scoring_method": "ai_scored",
         }
 
-        result = run_ai_relevance_scoring.apply(
-            args=[task.id, self.user.id],
-            kwargs={"force_rescore": True},
-        ).get()
+        result = run_ai_relevance_scoring(task.id, self.user.id, force_rescore=True)
 
         # Should have rescored
         task.refresh_from_db()
-        self.assertEqual(task.quadrant, "Q1")  # Changed from Q4
+        self.assertEqual(task.quadrant, Task.Quadrant.Q1)  # Changed from Q4
+
+    @patch("tasks.ai_engine.celery_tasks.AIOrchestrator")
+    def test_scoring_loads_task_and_weights_in_one_query(
+        self, mock_orchestrator_class: MagicMock
+    ) -> None:
+        """Task + GoalWeights fetch and the result UPDATE: two queries total."""
+        task = create_test_task(self.user)
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator_class.return_value = mock_orchestrator
+        mock_orchestrator.get_relevance_scores.return_value = {
+            "relevance_scores": {"work_bills": 0.9},
+            "confidence": 0.9,
+            "importance_score": 0.8,
+            "urgency_score": 0.7,
+            "quadrant": "Q1",
+            "rationale": "Scored",
+            "scoring_method": "ai_scored",
+        }
+
+        with self.assertNumQueries(2):
+            run_ai_relevance_scoring(task.id, self.user.id)
+
+        weights = mock_orchestrator.get_relevance_scores.call_args.kwargs["user_weights"]
+        self.assertEqual(weights["work_bills"], 0.4)
+
+    @patch("tasks.ai_engine.celery_tasks.AIOrchestrator")
+    def test_concurrent_result_is_not_overwritten(
+        self, mock_orchestrator_class: MagicMock
+    ) -> None:
+        """A result persisted by another worker mid-scoring should be kept."""
+        task = create_test_task(self.user)
+
+        def score_while_other_worker_finishes(**kwargs: Any) -> Dict[str, Any]:
+            Task.objects.filter(id=task.id).update(
+                is_prioritized=True,
+                last_analyzed_at=datetime.now(timezone.utc),
+                quadrant=Task.Quadrant.Q2,
+            )
+            return {
+                "relevance_scores": {"work_bills": 0.9},
+                "confidence": 0.9,
+                "importance_score": 0.8,
+                "urgency_score": 0.7,
+                "quadrant": "Q1",
+                "rationale": "Late result",
+                "scoring_method": "ai_scored",
+            }
+
+        mock_orchestrator = MagicMock()
+        mock_orchestrator_class.return_value = mock_orchestrator
+        mock_orchestrator.get_relevance_scores.side_effect = score_while_other_worker_finishes
+
+        result = run_ai_relevance_scoring(task.id, self.user.id)
+
+        self.assertEqual(result["status"], "skipped")
+        task.refresh_from_db()
+        self.assertEqual(task.quadrant, Task.Quadrant.Q2)
 
 
 # ===========================================================================
@@ -557,11 +889,12 @@ class TestCeleryTaskExecution(TransactionTestCase):
 # ===========================================================================
 
 
-class TestErrorHandling(TransactionTestCase):
+class TestErrorHandling(TestCase):
     """Tests for error handling in the scoring pipeline."""
 
     def setUp(self) -> None:
         """Set up test fixtures."""
+        cache.clear()
         self.user = create_test_user("error_test_user")
         create_test_goal_weights(self.user)
 
@@ -579,9 +912,7 @@ class TestErrorHandling(TransactionTestCase):
         # Execute - should not raise
         with self.assertRaises(Exception):
             # Task will raise for retry, but in test we catch it
-            run_ai_relevance_scoring.apply(
-                args=[task.id, self.user.id]
-            ).get()
+            run_ai_relevance_scoring(task.id, self.user.id)
 
         # Task should be marked as not prioritized
         task.refresh_from_db()
@@ -608,14 +939,413 @@ class TestErrorHandling(TransactionTestCase):
             "error_code": "API_ERROR",
         }
 
-        result = run_ai_relevance_scoring.apply(
-            args=[task.id, self.user.id]
-        ).get()
+        result = run_ai_relevance_scoring(task.id, self.user.id)
 
         # Task should be updated with fallback values
         task.refresh_from_db()
         self.assertTrue(task.is_prioritized)  # Still marked as processed
-        self.assertEqual(task.quadrant, "Q4")
+        self.assertEqual(task.quadrant, Task.Quadrant.Q4)
+
+    @patch("tasks.ai_engine.celery_tasks.AIOrchestrator")
+    def test_transient_failure_retries_without_persisting(
+        self, mock_orchestrator_class: MagicMock
+    ) -> None:
+        """A timeout fallback should schedule a retry and leave the task alone."""
+        task = create_test_task(self.user)
+        mock_orchestrator_class.return_value.get_relevance_scores.return_value = {
+            "relevance_scores": {"work_bills": 0.25},
+            "confidence": 0.0,
+            "importance_score": 0.25,
+            "urgency_score": 0.1,
+            "quadrant": "Q4",
+            "rationale": "Fallback due to error",
+            "scoring_method": "fallback",
+            "error_code": "TIMEOUT",
+        }
+
+        with self.assertRaises(Retry):
+            run_ai_relevance_scoring(task.id, self.user.id)
+
+        task.refresh_from_db()
+        self.assertFalse(task.is_prioritized)
+
+        # Once retries are exhausted the fallback is persisted as before
+        run_ai_relevance_scoring.apply(
+            args=(task.id, self.user.id), retries=run_ai_relevance_scoring.max_retries
+        )
+
+        task.refresh_from_db()
+        self.assertTrue(task.is_prioritized)
+        self.assertEqual(task.quadrant, Task.Quadrant.Q4)
+
+
+# ===========================================================================
+# BATCH SCORING TESTS
+# ===========================================================================
+
+
+def create_mock_openai_batch_response(
+    results: Dict[int, Dict[str, float]],
+    confidence: float = 0.85,
+) -> SimpleNamespace:
+    """Create a stub OpenAI response for a batch prompt keyed by task id."""
+    response_json = json.dumps({
+        str(task_id): {"relevance_scores": scores, "confidence": confidence}
+        for task_id, scores in results.items()
+    })
+
+    return _stub_openai_response(response_json)
+
+
+class TestBatchScoring(TestCase):
+    """Tests for scoring several tasks with one AI call."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = create_test_user("batch_test_user")
+        create_test_goal_weights(self.user)
+
+    @patch("tasks.ai_engine.external_scorer.OpenAI")
+    def test_scorer_batch_marks_missing_results(self, mock_openai_class: MagicMock) -> None:
+        """Tasks absent from the batch response should get MISSING_RESULT."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = create_mock_openai_batch_response(
+            {1: {"work_bills": 0.9, "study": 0.1}}
+        )
+
+        scorer = ExternalAIScorer(api_key="batch-key")
+        results = scorer.score_tasks_batch(
+            [(1, "Invoice", ""), (2, "Essay", "")],
+            {"work_bills": 0.5, "study": 0.5},
+        )
+
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(results[1]["relevance_scores"]["work_bills"], 0.9)
+        self.assertEqual(results[2]["error_code"], "MISSING_RESULT")
+
+    @patch.object(ExternalAIScorer, "MAX_BATCH_SIZE", 1)
+    @patch("tasks.ai_engine.external_scorer.OpenAI")
+    def test_scorer_batch_sends_chunks_over_shared_client(
+        self, mock_openai_class: MagicMock
+    ) -> None:
+        """Several chunks should each be sent through the one pooled client."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = create_mock_openai_batch_response({
+            1: {"work_bills": 0.9, "study": 0.1},
+            2: {"work_bills": 0.2, "study": 0.8},
+        })
+
+        scorer = ExternalAIScorer(api_key="chunk-key")
+        results = scorer.score_tasks_batch(
+            [(1, "Invoice", ""), (2, "Essay", "")],
+            {"work_bills": 0.5, "study": 0.5},
+        )
+
+        mock_openai_class.assert_called_once()
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+        self.assertEqual(results[1]["relevance_scores"]["work_bills"], 0.9)
+        self.assertEqual(results[2]["relevance_scores"]["study"], 0.8)
+
+    @patch("tasks.ai_engine.external_scorer.OpenAI")
+    def test_batch_task_scores_and_persists_with_one_ai_call(
+        self, mock_openai_class: MagicMock
+    ) -> None:
+        """All tasks should be scored by a single completion and bulk-updated."""
+        first = create_test_task(self.user, title="Quarterly report", description="")
+        second = create_test_task(self.user, title="Plan holiday", description="")
+        other_user_task = create_test_task(create_test_user("batch_other"))
+
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = create_mock_openai_batch_response({
+            first.id: {"work_bills": 1.0, "study": 0.0, "health": 0.0, "relationships": 0.0},
+            second.id: {"work_bills": 0.0, "study": 0.0, "health": 0.0, "relationships": 1.0},
+        })
+
+        with override_settings(OPENAI_API_KEY="test-key"):
+            summary = run_batch_ai_relevance_scoring(
+                [first.id, second.id, other_user_task.id], self.user.id
+            )
+
+        self.assertEqual(summary, {"scored": 2, "skipped": 1, "total": 3})
+        mock_client.chat.completions.create.assert_called_once()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        other_user_task.refresh_from_db()
+        self.assertTrue(first.is_prioritized)
+        self.assertAlmostEqual(first.importance_score, 0.4, places=4)
+        self.assertAlmostEqual(second.importance_score, 0.1, places=4)
+        self.assertIsNotNone(second.last_analyzed_at)
+        self.assertFalse(other_user_task.is_prioritized)
+
+
+# ===========================================================================
+# TASK CREATION TESTS
+# ===========================================================================
+
+
+class TestBulkRescore(TestCase):
+    """Tests for the bulk_rescore_tasks fan-out task."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = create_test_user("rescore_test_user")
+
+    @patch("tasks.ai_engine.celery_tasks.group")
+    def test_queues_only_owned_tasks_with_one_lookup(self, mock_group: MagicMock) -> None:
+        """Ownership is checked in a single query; foreign ids are skipped."""
+        owned = [create_test_task(self.user, title=f"Task {i}") for i in range(3)]
+        foreign = create_test_task(create_test_user("rescore_other_user"))
+        _get_user_weights(self.user.id)  # weights already cached
+
+        with self.assertNumQueries(1):
+            summary = bulk_rescore_tasks(
+                [task.id for task in owned] + [foreign.id], self.user.id
+            )
+
+        self.assertEqual(summary, {"queued": 3, "skipped": 1, "total": 4})
+        # All owned tasks go out in one group dispatch
+        mock_group.assert_called_once()
+        mock_group.return_value.apply_async.assert_called_once_with()
+        signatures = mock_group.call_args.args[0]
+        self.assertEqual(
+            [sig.args for sig in signatures],
+            [(task.id, self.user.id) for task in owned],
+        )
+        self.assertTrue(all(sig.kwargs == {"force_rescore": True} for sig in signatures))
+
+    @patch("tasks.ai_engine.celery_tasks.group")
+    def test_warms_weights_cache_before_dispatch(self, mock_group: MagicMock) -> None:
+        """Workers in the rescoring burst should read weights from the cache."""
+        create_test_goal_weights(self.user)
+        tasks = [create_test_task(self.user, title=f"Task {i}") for i in range(3)]
+
+        bulk_rescore_tasks([task.id for task in tasks], self.user.id)
+
+        with self.assertNumQueries(0):
+            for _ in tasks:
+                weights = _get_user_weights(self.user.id)
+        self.assertAlmostEqual(weights["work_bills"], 0.4)
+
+    @patch("tasks.ai_engine.celery_tasks.group")
+    def test_dispatch_failure_counts_all_as_skipped(self, mock_group: MagicMock) -> None:
+        """A broker error while publishing the group queues nothing."""
+        task = create_test_task(self.user)
+        mock_group.return_value.apply_async.side_effect = ConnectionError("broker down")
+
+        summary = bulk_rescore_tasks([task.id], self.user.id)
+
+        self.assertEqual(summary, {"queued": 0, "skipped": 1, "total": 1})
+
+
+class TestRescoreUserTasks(TestCase):
+    """Tests for the rescore-everything entry point."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = create_test_user("rescore_all_user")
+
+    @patch("tasks.ai_engine.celery_tasks.RESCORE_CHUNK_SIZE", 2)
+    @patch("tasks.ai_engine.celery_tasks.group")
+    def test_open_tasks_are_chunked_into_one_group(self, mock_group: MagicMock) -> None:
+        """Open tasks go out as batch jobs of RESCORE_CHUNK_SIZE in one group."""
+        tasks = [create_test_task(self.user, title=f"Task {i}") for i in range(3)]
+        done = create_test_task(self.user, title="Done")
+        Task.objects.filter(id=done.id).update(is_completed=True)
+
+        summary = rescore_user_tasks(self.user.id)
+
+        self.assertEqual(summary, {"queued": 3, "batches": 2})
+        mock_group.return_value.apply_async.assert_called_once_with()
+        signatures = list(mock_group.call_args.args[0])
+        self.assertEqual(
+            [sig.args for sig in signatures],
+            [([tasks[0].id, tasks[1].id], self.user.id), ([tasks[2].id], self.user.id)],
+        )
+
+    @patch("tasks.ai_engine.celery_tasks.group")
+    def test_user_without_tasks_dispatches_nothing(self, mock_group: MagicMock) -> None:
+        """Nothing is published when the user has no open tasks."""
+        self.assertEqual(rescore_user_tasks(self.user.id), {"queued": 0, "batches": 0})
+        mock_group.assert_not_called()
+
+
+class TestTaskCreationDispatch(TestCase):
+    """Tests for enqueueing the scoring job from TaskSerializer.create."""
+
+    def setUp(self) -> None:
+        self.user = create_test_user("dispatch_test_user")
+
+    @patch("tasks.ai_engine.celery_tasks.run_ai_relevance_scoring.apply_async")
+    def test_create_persists_celery_id_and_dispatches_with_it(
+        self, mock_apply_async: MagicMock
+    ) -> None:
+        """The Celery id is stored on INSERT and reused as the job's task_id."""
+        request = MagicMock(user=self.user)
+        serializer = TaskSerializer(
+            data={"title": "Write report", "effort_estimate": 2},
+            context={"request": request},
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task = serializer.save()
+
+        task.refresh_from_db()
+        self.assertTrue(task.celery_task_id)
+        mock_apply_async.assert_called_once_with(
+            args=(task.id, self.user.id), task_id=task.celery_task_id
+        )
+
+
+class TestScoreStatusView(TestCase):
+    """Tests for the score-status endpoint."""
+
+    def setUp(self) -> None:
+        self.user = create_test_user("status_test_user")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_prioritized_task_returns_complete_without_waiting(self) -> None:
+        """An already scored task should answer immediately."""
+        task = create_test_task(self.user)
+        Task.objects.filter(id=task.id).update(is_prioritized=True, quadrant=Task.Quadrant.Q1)
+
+        with patch("tasks.views.AsyncResult") as mock_async_result:
+            response = self.client.get(reverse("task-score-status", args=[task.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "complete")
+        self.assertEqual(response.data["task"]["quadrant"], "Q1")
+        mock_async_result.assert_not_called()
+
+    @patch("tasks.views.AsyncResult")
+    def test_pending_task_waits_on_celery_result(self, mock_async_result: MagicMock) -> None:
+        """A pending task should block on its Celery result for the requested wait."""
+        task = create_test_task(self.user)
+        Task.objects.filter(id=task.id).update(celery_task_id="job-123")
+
+        response = self.client.get(
+            reverse("task-score-status", args=[task.id]), {"wait": "5"}
+        )
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "pending")
+        mock_async_result.assert_called_once_with("job-123")
+        mock_async_result.return_value.get.assert_called_once_with(
+            timeout=5.0, propagate=False
+        )
+
+    @patch("tasks.views.AsyncResult")
+    def test_pending_task_answers_immediately_by_default(
+        self, mock_async_result: MagicMock
+    ) -> None:
+        """Without ?wait= a pending task gets 202 and Retry-After, no blocking."""
+        task = create_test_task(self.user)
+        Task.objects.filter(id=task.id).update(celery_task_id="job-789")
+
+        response = self.client.get(reverse("task-score-status", args=[task.id]))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response["Retry-After"], str(SCORE_STATUS_RETRY_AFTER))
+        mock_async_result.assert_not_called()
+
+    @override_settings(TASK_SCORE_STATUS_MAX_WAIT=SCORE_STATUS_MAX_WAIT)
+    @patch("tasks.views.AsyncResult")
+    def test_requested_wait_is_capped(self, mock_async_result: MagicMock) -> None:
+        """A long ?wait= is clamped to the configured maximum."""
+        task = create_test_task(self.user)
+        Task.objects.filter(id=task.id).update(celery_task_id="job-321")
+
+        self.client.get(reverse("task-score-status", args=[task.id]), {"wait": "600"})
+
+        mock_async_result.return_value.get.assert_called_once_with(
+            timeout=SCORE_STATUS_MAX_WAIT, propagate=False
+        )
+
+    @patch("tasks.views.AsyncResult")
+    def test_no_result_backend_does_not_poll_the_row(
+        self, mock_async_result: MagicMock
+    ) -> None:
+        """Without a result backend the wait returns at once instead of polling."""
+        task = create_test_task(self.user)
+        Task.objects.filter(id=task.id).update(celery_task_id="job-654")
+        mock_async_result.return_value.get.side_effect = NotImplementedError
+
+        # get_object, the owner permission check, refresh_from_db
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse("task-score-status", args=[task.id]), {"wait": "5"}
+            )
+
+        self.assertEqual(response.status_code, 202)
+
+    @override_settings(TASK_SCORE_STATUS_MAX_WAIT=0)
+    @patch("tasks.views.AsyncResult")
+    def test_zero_max_wait_setting_answers_immediately(
+        self, mock_async_result: MagicMock
+    ) -> None:
+        """With the wait disabled in settings, a pending task is not waited on."""
+        task = create_test_task(self.user)
+        Task.objects.filter(id=task.id).update(celery_task_id="job-456")
+
+        response = self.client.get(reverse("task-score-status", args=[task.id]))
+
+        self.assertEqual(response.data["status"], "pending")
+        mock_async_result.assert_not_called()
+
+    def test_pending_task_has_null_quadrant(self) -> None:
+        """An unscored task's quadrant serializes as null, not a code."""
+        task = create_test_task(self.user)
+
+        response = self.client.get(
+            reverse("task-score-status", args=[task.id]), {"wait": "0"}
+        )
+
+        self.assertIsNone(response.data["task"]["quadrant"])
+
+    def test_other_users_task_is_not_found(self) -> None:
+        """Users cannot poll tasks they do not own."""
+        other = create_test_user("status_other_user")
+        task = create_test_task(other)
+
+        response = self.client.get(reverse("task-score-status", args=[task.id]))
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestTaskListQueries(TestCase):
+    """Query-count guards for the task list endpoints."""
+
+    def setUp(self) -> None:
+        self.user = create_test_user("list_query_user")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        goal = Goal.objects.create(user=self.user, title="Career", weight=5)
+        for i in range(5):
+            Task.objects.create(user=self.user, title=f"Task {i}", goal=goal)
+
+    def test_list_does_not_query_per_task(self) -> None:
+        """Serializing `goal` uses goal_id, so the list is a single SELECT."""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("create-list-view"))
+
+        self.assertEqual(len(response.data), 5)
+
+    def test_prioritized_list_in_priority_order(self) -> None:
+        """Only open prioritized tasks are listed, highest priority first, in one SELECT."""
+        Task.objects.filter(title__in=["Task 1", "Task 3"]).update(is_prioritized=True)
+        Task.objects.filter(title="Task 3").update(priority_score=0.9, quadrant=Task.Quadrant.Q1)
+        Task.objects.filter(title="Task 1").update(priority_score=0.2)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("prioritized-list"))
+
+        self.assertEqual([row["title"] for row in response.data], ["Task 3", "Task 1"])
+        self.assertEqual(response.data[0]["quadrant"], "Q1")
 
 
 # ===========================================================================
@@ -623,11 +1353,12 @@ class TestErrorHandling(TransactionTestCase):
 # ===========================================================================
 
 
-class TestEndToEndFlow(TransactionTestCase):
+class TestEndToEndFlow(TestCase):
     """End-to-end integration test for the full scoring flow."""
 
     def setUp(self) -> None:
         """Set up test fixtures."""
+        cache.clear()
         self.user = create_test_user("e2e_test_user")
         create_test_goal_weights(
             self.user,
@@ -672,9 +1403,7 @@ class TestEndToEndFlow(TransactionTestCase):
 
         # Execute scoring
         with override_settings(OPENAI_API_KEY="test-key"):
-            result = run_ai_relevance_scoring.apply(
-                args=[task.id, self.user.id]
-            ).get()
+            result = run_ai_relevance_scoring(task.id, self.user.id)
 
         # Verify final state
         task.refresh_from_db()
@@ -683,7 +1412,7 @@ class TestEndToEndFlow(TransactionTestCase):
         # - High work relevance (0.95) × high work weight (0.5) = high importance
         # - Due tomorrow with high effort = high urgency
         self.assertTrue(task.is_prioritized)
-        self.assertEqual(task.quadrant, "Q1")
+        self.assertEqual(task.quadrant, Task.Quadrant.Q1)
         self.assertGreater(task.importance_score, 0.4)  # Should be significant
         self.assertGreater(task.urgency_score, 0.7)  # Should be high (due tomorrow)
         self.assertIsNotNone(task.last_analyzed_at)
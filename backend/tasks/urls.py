@@ -1,7 +1,7 @@
 from django.urls import path
-from .views import list_create_view
-from .views import retreive_update_destroy_view
-from .views  import tasks_list_view
+from .views import (
+    list_create_view, retreive_update_destroy_view, score_status_view, tasks_list_view,
+)
 
 urlpatterns=[
     # GET and POST (List active tasks and Create new task)
@@ -10,6 +10,10 @@ urlpatterns=[
     path('prioritized-list/',tasks_list_view,name="prioritized-list"),
     
     # GET, PUT, PATCH, DELETE (Detail and Manipulation)
-    path('<int:pk>/',retreive_update_destroy_view,name="task-detail")
+    path('<int:pk>/',retreive_update_destroy_view,name="task-detail"),
+
+    # GET (AI prioritization status: 200 once scored, else 202 + Retry-After;
+    # ?wait=<seconds> blocks up to TASK_SCORE_STATUS_MAX_WAIT first)
+    path('<int:pk>/score-status/',score_status_view,name="task-score-status")
 
 ]
\ No newline at end of file
@@ -1,11 +1,23 @@
-from django.shortcuts import render
-
 # Create your views here.
 from datetime import date
-from rest_framework import generics, permissions
+
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.result import AsyncResult
+from django.conf import settings
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+
 from .models import Task
 from .serializers import TaskSerializer
 
+# Longest a score-status request may block when the client opts in with
+# `?wait=<seconds>` (seconds). Kept short: a sync worker is held for the whole
+# wait. Default for settings.TASK_SCORE_STATUS_MAX_WAIT (0 never waits).
+SCORE_STATUS_MAX_WAIT = 5.0
+
+# Retry-After sent with a pending (202) score-status response (seconds)
+SCORE_STATUS_RETRY_AFTER = 2
+
 class TaskOwnerPermission(permissions.BasePermission):
     """
     Custom permission to only allow owners of a Task to view, edit, or delete it.
@@ -20,11 +32,10 @@ class TaskListCreateView(generics.ListCreateAPIView):
     """
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = Task.objects.all()
 
     def get_queryset(self):
-        # ensure user only sees own tasks
-        return Task.objects.filter(user=self.request.user)
+        # ensure user only sees own tasks; only the serialized columns are loaded
+        return Task.objects.filter(user=self.request.user).only(*TaskSerializer.Meta.fields)
 
 list_create_view=TaskListCreateView.as_view()
 
@@ -53,10 +64,75 @@ class PrioritizedTaskListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
+        # Only the serialized columns are loaded
         return Task.objects.filter(
             user=self.request.user,
             is_prioritized=True,
             is_completed=False
-        ).order_by('-priority_score')
+        ).only(*TaskSerializer.Meta.fields).order_by('-priority_score')
     
-tasks_list_view=PrioritizedTaskListView.as_view()
\ No newline at end of file
+tasks_list_view=PrioritizedTaskListView.as_view()
+
+
+def _wait_for_scoring(task, timeout):
+    """
+    Block until the task's scoring job finishes or `timeout` seconds pass.
+
+    Only waits on the Celery result; without a result backend there is nothing
+    to wait on and the call returns at once (the client re-polls instead).
+    """
+    if timeout <= 0:
+        return
+
+    try:
+        AsyncResult(task.celery_task_id).get(timeout=timeout, propagate=False)
+    except (CeleryTimeoutError, NotImplementedError):
+        # Timed out, or no result backend configured
+        pass
+
+
+class TaskScoreStatusView(generics.RetrieveAPIView):
+    """
+    GET: AI prioritization status of a task.
+
+    Answers immediately by default: 200 once scored, otherwise 202 with a
+    Retry-After header telling the client when to poll again. `?wait=<seconds>`
+    (capped at the configured max wait) blocks on the Celery result first.
+    Returns {"status": "complete" | "pending", "task": <task>}.
+    """
+    serializer_class = TaskSerializer
+    permission_classes = [permissions.IsAuthenticated, TaskOwnerPermission]
+
+    def get_queryset(self):
+        return Task.objects.filter(user=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        task = self.get_object()
+
+        if not task.is_prioritized and task.celery_task_id:
+            wait = self._requested_wait(request)
+            if wait > 0:
+                _wait_for_scoring(task, wait)
+                task.refresh_from_db()
+
+        data = {
+            "status": "complete" if task.is_prioritized else "pending",
+            "task": self.get_serializer(task).data,
+        }
+        if task.is_prioritized:
+            return Response(data)
+        return Response(
+            data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Retry-After": str(SCORE_STATUS_RETRY_AFTER)},
+        )
+
+    def _requested_wait(self, request):
+        max_wait = float(getattr(settings, "TASK_SCORE_STATUS_MAX_WAIT", SCORE_STATUS_MAX_WAIT))
+        try:
+            wait = float(request.query_params.get("wait", 0))
+        except (TypeError, ValueError):
+            wait = 0.0
+        return max(0.0, min(max_wait, wait))
+
+score_status_view=TaskScoreStatusView.as_view()
@@ -1,3 +1,4 @@
+import logging
 import os
 from dotenv import load_dotenv
 from django.conf import settings
@@ -9,6 +10,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tfshome.settings')
 
 app = Celery('tfshome')
 
+logger = logging.getLogger(__name__)
+
 # Using a string here means the worker doesn't have to serialize
 # the configuration object to child processes.
 # - namespace='CELERY' means all celery-related configuration keys
@@ -22,4 +25,4 @@ app.autodiscover_tasks(['celery_tasks.ai_engine'])
 
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
-    print(f'Request: {self.request!r}')
\ No newline at end of file
+    logger.info(f'Request: {self.request!r}')
\ No newline at end of file
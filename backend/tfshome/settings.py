@@ -153,8 +153,21 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.LightJWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        # Every registration attempt pays for a password hash
+        'register': '5/min',
+    },
 }
 
 AUTH_USER_MODEL='users.CustomUser'
@@ -210,4 +223,9 @@ SIMPLE_JWT = {
 }
 
 #Set up OPENAI API key 
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
\ No newline at end of file
+OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+
+# Task score-status endpoint: answers immediately (202 + Retry-After while
+# scoring is pending). A client may pass ?wait=<seconds> to block on the
+# scoring job first; this caps that wait in seconds, and 0 disables it.
+TASK_SCORE_STATUS_MAX_WAIT = float(os.getenv('TASK_SCORE_STATUS_MAX_WAIT', 5))
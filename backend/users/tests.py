@@ -1,3 +1,183 @@
+# users/tests.py
+"""
+Users App Test Suite
+====================
+
+Tests for registration and the authenticated user endpoints.
+
+Test Categories:
+----------------
+1. Registration API Tests - Throttling and request parsing
+2. User Detail API Tests - Per-token payload cache
+3. Authentication Tests - Narrow user loading in LightJWTAuthentication
+"""
+
+import io
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from api.parsers import ORJSONParser
+
+from .authentication import LightJWTAuthentication
+from .serializers import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+def create_user(email="user@example.com", **kwargs):
+    """Create a user without paying for a password hash."""
+    return User.objects.create_user(
+        email=email,
+        password=None,
+        username=kwargs.pop("username", email.split("@")[0]),
+        first_name="Test",
+        last_name="User",
+        **kwargs,
+    )
+
+
+def access_token_for(user):
+    """Mint an access token the same way RegisterView does."""
+    return str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+
+
+# ===========================================================================
+# REGISTRATION API TESTS
+# ===========================================================================
+
+
+class RegisterAPITests(TestCase):
+    """Tests for POST /api/v1/auth/register/."""
+
+    url = "/api/v1/auth/register/"
+
+    def setUp(self):
+        cache.clear()  # throttle history lives in the cache
+        self.client = APIClient()
+
+    def test_sixth_attempt_within_a_minute_is_throttled(self):
+        """Attempts are counted before validation, so invalid ones count too."""
+        for _ in range(5):
+            response = self.client.post(self.url, {}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+
+    def test_malformed_json_returns_parse_error(self):
+        response = self.client.post(
+            self.url, data=b'{"email": ', content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(response.data["detail"].startswith("JSON parse error"))
+
+    def test_integers_wider_than_64_bits_are_parsed_exactly(self):
+        body = b'{"n": 123456789012345678901234567890, "m": -9223372036854775809}'
+
+        data = ORJSONParser().parse(io.BytesIO(body))
+
+        self.assertEqual(data, JSONParser().parse(io.BytesIO(body)))
+        self.assertEqual(data["n"], 123456789012345678901234567890)
+        self.assertIsInstance(data["m"], int)
+
+    def test_out_of_range_float_is_accepted_like_stock_parser(self):
+        body = b'{"x": 1e400}'
+
+        data = ORJSONParser().parse(io.BytesIO(body))
+
+        self.assertEqual(data, JSONParser().parse(io.BytesIO(body)))
+        self.assertEqual(data["x"], float("inf"))
+
+
+# ===========================================================================
+# USER DETAIL API TESTS
+# ===========================================================================
+
+
+class UserDetailAPITests(TestCase):
+    """Tests for GET /api/v1/auth/user/."""
+
+    url = "/api/v1/auth/user/"
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token_for(self.user)}")
+
+    def test_first_request_loads_user_then_cache_hit_issues_no_queries(self):
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.data["email"], self.user.email)
+        self.assertEqual(second["Cache-Control"], "private, max-age=30")
+
+    def test_inactive_user_rejected_on_cache_miss(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_missing_token_is_rejected(self):
+        self.client.credentials()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+# ===========================================================================
+# AUTHENTICATION TESTS
+# ===========================================================================
+
+
+class LightJWTAuthenticationTests(TestCase):
+    """Tests for the narrow request.user load."""
+
+    def setUp(self):
+        self.user = create_user()
+        self.auth = LightJWTAuthentication()
+
+    def test_password_hash_is_not_loaded(self):
+        token = self.auth.get_validated_token(access_token_for(self.user))
+
+        with self.assertNumQueries(1):
+            user = self.auth.get_user(token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertIn("password", user.get_deferred_fields())
+
+    def test_password_hash_loaded_when_revoke_check_enabled(self):
+        # simple-jwt modules share one api_settings object bound at import, so
+        # patch it rather than overriding SIMPLE_JWT
+        with patch.object(api_settings, "CHECK_REVOKE_TOKEN", True):
+            token = self.auth.get_validated_token(access_token_for(self.user))
+            user = self.auth.get_user(token)
+
+        self.assertNotIn("password", user.get_deferred_fields())
+
+    def test_inactive_user_is_rejected(self):
+        token = self.auth.get_validated_token(access_token_for(self.user))
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed) as ctx:
+            self.auth.get_user(token)
 
-# Create your tests here.
+        self.assertEqual(ctx.exception.detail["code"], "user_inactive")
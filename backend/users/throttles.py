@@ -0,0 +1,16 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class RegisterRateThrottle(SimpleRateThrottle):
+    """
+    Per-IP limit on registration attempts, authenticated or not. Runs before
+    the request body is validated, so rejected attempts never reach the
+    password hasher.
+    """
+    scope = 'register'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
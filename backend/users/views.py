@@ -1,4 +1,11 @@
 # Create your views here.
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.views import APIView
 from rest_framework import  status
 from rest_framework.response import Response
@@ -7,6 +14,18 @@ from .serializers import (UserRegistrationSerializer,
                            UserDetailsSerializer
                         ) 
 from rest_framework.permissions import AllowAny,IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+from api.renderers import ORJSONRenderer
+from .throttles import RegisterRateThrottle
+
+User=get_user_model()
+
+# Upper bound on how long a /user/ payload is reused for one access token
+USER_DETAIL_CACHE_TTL = 60
+
+# How long clients may reuse a /user/ response without asking again
+USER_DETAIL_MAX_AGE = 30
 
 class RegisterView(APIView):
     """
@@ -14,38 +33,32 @@ class RegisterView(APIView):
     logs the user in by generating and returning the Access and Refresh tokens.
     """
     serializer_class = UserRegistrationSerializer
+    # Registration never looks at request.user; skipping authentication avoids
+    # decoding (and loading the user for) any token a client sends along
+    authentication_classes = ()
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterRateThrottle]
     
     def post(self, request, *args, **kwargs):
         # 1. Validate incoming registration data
-        serializer = UserRegistrationSerializer(data=request.data)
+        serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save() # User is created here
 
-        # 2. Prepare payload for auto-login
-        # We need to construct a payload that the CustomTokenObtainPairSerializer can process
-        token_payload = {
-            # Use the user's email and password directly
-            'email': user.email,
-            'password': request.data['password'] # We must use the raw password from the request
-        }
+        # One transaction for the user INSERT and anything hooked onto it, so
+        # a failure while issuing tokens never leaves a half-registered user
+        with transaction.atomic():
+            user = serializer.save() # User is created here
 
-        # 3. Generate Tokens using the Custom Serializer
-        # We instantiate the CustomTokenObtainPairSerializer with the auto-login data
-        token_serializer = CustomTokenObtainPairSerializer(data=token_payload)
-        
-        try:
-            token_serializer.is_valid(raise_exception=True)
-        except Exception as e:
-            # Should not happen if registration was successful, but good for robustness
-            print(f"Token generation failed: {e}")
-            return Response(
-                {"detail": "User created but failed to generate token."}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+            # 2. Generate Tokens straight from the created user
+            # get_token adds the custom claims without re-authenticating, so the
+            # password is not hashed a second time and the user is not re-fetched
+            refresh = CustomTokenObtainPairSerializer.get_token(user)
 
-        # 4. Return Success Response with Tokens
-        response_data = token_serializer.validated_data
+        # 3. Return Success Response with Tokens
+        response_data = {
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+        }
         
         # Optionally, include basic user data in the response
         response_data['user'] = {
@@ -58,6 +71,16 @@ class RegisterView(APIView):
 
 
 register_view=RegisterView.as_view()
+
+# Shared, unbound serializer: to_representation keeps no per-call state, so one
+# instance serves every request instead of rebuilding the fields each time
+_USER_DETAILS = UserDetailsSerializer()
+
+
+def user_detail_cache_key(jti):
+    """Cache key for the /user/ payload served to one access token."""
+    return f"user_detail:{jti}"
+
 class UserDetailAPIView(APIView):
     """
     Docstring for UserDetailAPIView
@@ -65,9 +88,36 @@ class UserDetailAPIView(APIView):
     Requires a valid JWT Access Token.
     """
     permission_classes=[IsAuthenticated]
+    # Validates the token without loading the user; the row is only read
+    # when the payload for this token isn't cached yet
+    authentication_classes=[JWTStatelessUserAuthentication]
+    # JSON only: no content negotiation against the browsable API
+    renderer_classes=[ORJSONRenderer]
+
     def get(self,request,format=None,*args,**kwargs):
-        # request.user is automatically populated by JWTAuthentication if token is valid
-        serializer = UserDetailsSerializer(request.user)
-        return Response(serializer.data)
+        token = request.auth
+        cache_key = user_detail_cache_key(token['jti'])
+
+        data = cache.get(cache_key)
+        if data is None:
+            user = (
+                User.objects.filter(pk=request.user.id, is_active=True)
+                .only(*UserDetailsSerializer.Meta.fields)
+                .first()
+            )
+            if user is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            data = _USER_DETAILS.to_representation(user)
+
+            # Never outlive the token itself; expired tokens fail auth anyway
+            ttl = min(USER_DETAIL_CACHE_TTL, int(token['exp'] - time.time()))
+            if ttl > 0:
+                cache.set(cache_key, data, timeout=ttl)
+
+        response = Response(data)
+        # Private to the token's holder; repeat polls are answered by the client
+        patch_cache_control(response, private=True, max_age=USER_DETAIL_MAX_AGE)
+        patch_vary_headers(response, ('Authorization',))
+        return response
 
 user_detail_view=UserDetailAPIView.as_view() 
\ No newline at end of file